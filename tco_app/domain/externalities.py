@@ -52,20 +52,23 @@ def _compute_detailed_externalities(
         else vehicle_externalities[DataColumns.COST_PER_KM].sum()
     )
 
+    # NPV is linear in the annual cost, so one discounting factor serves every
+    # pollutant instead of re-discounting each row.
+    npv_per_unit = calculate_npv(1.0, discount_rate, truck_life_years)
     breakdown: Dict[str, Any] = {}
-    for _, row in vehicle_externalities.iterrows():
-        if row[DataColumns.POLLUTANT_TYPE] == "externalities_total":
+    for pollutant, cost_per_km in zip(
+        vehicle_externalities[DataColumns.POLLUTANT_TYPE].tolist(),
+        vehicle_externalities[DataColumns.COST_PER_KM].tolist(),
+    ):
+        if pollutant == "externalities_total":
             continue
-        pollutant = row[DataColumns.POLLUTANT_TYPE]
-        cost_per_km = row[DataColumns.COST_PER_KM]
         annual_cost = cost_per_km * annual_kms
         lifetime_cost = annual_cost * truck_life_years
-        npv_cost = calculate_npv(annual_cost, discount_rate, truck_life_years)
         breakdown[pollutant] = {
             "cost_per_km": cost_per_km,
             "annual_cost": annual_cost,
             "lifetime_cost": lifetime_cost,
-            "npv_cost": npv_cost,
+            "npv_cost": annual_cost * npv_per_unit,
         }
 
     return float(total_externality_per_km), breakdown
@@ -11,6 +11,7 @@ behaviour is unchanged.  Only import paths were updated where the monolith
 previously referenced legacy modules.
 """
 
+from dataclasses import replace
 from typing import Any, Dict, List, Union
 
 from tco_app.domain.energy import calculate_energy_costs
@@ -29,6 +30,14 @@ from tco_app.src.utils.battery import calculate_battery_replacement
 
 __all__ = ["perform_sensitivity_analysis", "perform_sensitivity_analysis_with_dtos"]
 
+_SWEEPABLE_PARAMETERS = (
+    "Annual Distance (km)",
+    "Diesel Price ($/L)",
+    "Vehicle Lifetime (years)",
+    "Discount Rate (%)",
+    "Electricity Price ($/kWh)",
+)
+
 # --------------------------------------------------------------------------------------
 # perform_sensitivity_analysis (verbatim copy)
 # --------------------------------------------------------------------------------------
@@ -62,10 +71,39 @@ def perform_sensitivity_analysis(
     organisation, not behaviour.
     """
     results: List[Dict[str, Any]] = []
+    if parameter_name not in _SWEEPABLE_PARAMETERS:
+        # Unsupported parameter name – nothing to calculate
+        return results
+
+    # Inputs that no swept parameter touches are resolved once for the pair
+    # rather than recomputed for both vehicles at every parameter value.
+    bev_acquisition = calculate_acquisition_cost(
+        bev_vehicle_data,
+        bev_fees,
+        incentives,
+        apply_incentives,
+    )
+    diesel_acquisition = calculate_acquisition_cost(
+        diesel_vehicle_data,
+        diesel_fees,
+        incentives,
+        apply_incentives,
+    )
+    initial_dep = financial_params[
+        financial_params[DataColumns.FINANCE_DESCRIPTION]
+        == ParameterKeys.INITIAL_DEPRECIATION
+    ].iloc[0][DataColumns.FINANCE_DEFAULT_VALUE]
+    annual_dep = financial_params[
+        financial_params[DataColumns.FINANCE_DESCRIPTION]
+        == ParameterKeys.ANNUAL_DEPRECIATION
+    ].iloc[0][DataColumns.FINANCE_DEFAULT_VALUE]
+    infra_data = infrastructure_options[
+        infrastructure_options[DataColumns.INFRASTRUCTURE_ID]
+        == selected_infrastructure
+    ].iloc[0]
 
     for param_value in parameter_range:
-        financial_params_copy = financial_params.copy()
-        battery_params_copy = battery_params.copy()
+        financial_params_copy = financial_params
         current_annual_kms = annual_kms
         current_discount_rate = discount_rate
         current_truck_life_years = truck_life_years
@@ -75,6 +113,7 @@ def perform_sensitivity_analysis(
         if parameter_name == "Annual Distance (km)":
             current_annual_kms = param_value
         elif parameter_name == "Diesel Price ($/L)":
+            financial_params_copy = financial_params.copy()
             financial_params_copy.loc[
                 financial_params_copy[DataColumns.FINANCE_DESCRIPTION]
                 == ParameterKeys.DIESEL_PRICE,
@@ -138,29 +177,7 @@ def perform_sensitivity_analysis(
             apply_incentives,
         )
 
-        # --------------- Acquisition & residual ---------------
-        bev_acquisition = calculate_acquisition_cost(
-            bev_vehicle_data,
-            bev_fees,
-            incentives,
-            apply_incentives,
-        )
-        diesel_acquisition = calculate_acquisition_cost(
-            diesel_vehicle_data,
-            diesel_fees,
-            incentives,
-            apply_incentives,
-        )
-
-        initial_dep = financial_params_copy[
-            financial_params_copy[DataColumns.FINANCE_DESCRIPTION]
-            == ParameterKeys.INITIAL_DEPRECIATION
-        ].iloc[0][DataColumns.FINANCE_DEFAULT_VALUE]
-        annual_dep = financial_params_copy[
-            financial_params_copy[DataColumns.FINANCE_DESCRIPTION]
-            == ParameterKeys.ANNUAL_DEPRECIATION
-        ].iloc[0][DataColumns.FINANCE_DEFAULT_VALUE]
-
+        # --------------- Residual ---------------
         bev_residual = calculate_residual_value(
             bev_vehicle_data,
             current_truck_life_years,
@@ -177,7 +194,7 @@ def perform_sensitivity_analysis(
         # --------------- Battery replacement ---------------
         bev_battery_replacement = calculate_battery_replacement(
             bev_vehicle_data,
-            battery_params_copy,
+            battery_params,
             current_truck_life_years,
             current_discount_rate,
         )
@@ -219,10 +236,6 @@ def perform_sensitivity_analysis(
         )
 
         # --------------- Infrastructure ---------------
-        infra_data = infrastructure_options[
-            infrastructure_options[DataColumns.INFRASTRUCTURE_ID]
-            == selected_infrastructure
-        ].iloc[0]
         infra_costs = calculate_infrastructure_costs(
             infra_data,
             current_truck_life_years,
@@ -266,7 +279,6 @@ def perform_sensitivity_analysis(
 # New DTO-based sensitivity analysis
 # --------------------------------------------------------------------------------------
 
-from copy import deepcopy
 from tco_app.services.dtos import (
     SensitivityRequest,
     SensitivityResult,
@@ -295,50 +307,54 @@ def perform_sensitivity_analysis_with_dtos(
     Returns:
         List of SensitivityResult objects, one for each parameter value
     """
-    results: List[SensitivityResult] = []
+    return [
+        _evaluate_parameter_value(sensitivity_request, tco_service, value)
+        for value in sensitivity_request.parameter_range
+    ]
+
+
+def _evaluate_parameter_value(
+    sensitivity_request: SensitivityRequest,
+    tco_service: Any,
+    param_value: float,
+) -> SensitivityResult:
+    """Calculate both vehicles' TCO with the swept parameter set to *param_value*."""
+    # Create deep copies of the calculation requests to avoid modifying originals
+    base_request = _create_modified_request(
+        sensitivity_request.base_calculation_request,
+        sensitivity_request.parameter_name,
+        param_value,
+    )
     
-    for param_value in sensitivity_request.parameter_range:
-        # Create deep copies of the calculation requests to avoid modifying originals
-        base_request = _create_modified_request(
-            sensitivity_request.base_calculation_request,
-            sensitivity_request.parameter_name,
-            param_value,
-        )
-        
-        comparison_request = _create_modified_request(
-            sensitivity_request.comparison_calculation_request,
-            sensitivity_request.parameter_name,
-            param_value,
-        )
-        
-        # Calculate TCO for both vehicles at this parameter value
-        base_result = tco_service.calculate_single_vehicle_tco(base_request)
-        comparison_result = tco_service.calculate_single_vehicle_tco(comparison_request)
-        
-        # Calculate differences
-        tco_difference = base_result.tco_per_km - comparison_result.tco_per_km
-        percentage_difference = safe_division(
-            tco_difference,
-            comparison_result.tco_per_km,
-            context="sensitivity percentage calculation"
-        ) * 100
-        
-        # Create result
-        sensitivity_result = SensitivityResult(
-            parameter_value=param_value,
-            base_tco_result=base_result,
-            comparison_tco_result=comparison_result,
-            tco_difference=tco_difference,
-            percentage_difference=percentage_difference,
-            base_tco_per_km=base_result.tco_per_km,
-            comparison_tco_per_km=comparison_result.tco_per_km,
-            base_annual_operating_cost=base_result.annual_operating_cost,
-            comparison_annual_operating_cost=comparison_result.annual_operating_cost,
-        )
-        
-        results.append(sensitivity_result)
+    comparison_request = _create_modified_request(
+        sensitivity_request.comparison_calculation_request,
+        sensitivity_request.parameter_name,
+        param_value,
+    )
     
-    return results
+    # Calculate TCO for both vehicles at this parameter value
+    base_result = tco_service.calculate_single_vehicle_tco(base_request)
+    comparison_result = tco_service.calculate_single_vehicle_tco(comparison_request)
+    
+    # Calculate differences
+    tco_difference = base_result.tco_per_km - comparison_result.tco_per_km
+    percentage_difference = safe_division(
+        tco_difference,
+        comparison_result.tco_per_km,
+        context="sensitivity percentage calculation"
+    ) * 100
+    
+    return SensitivityResult(
+        parameter_value=param_value,
+        base_tco_result=base_result,
+        comparison_tco_result=comparison_result,
+        tco_difference=tco_difference,
+        percentage_difference=percentage_difference,
+        base_tco_per_km=base_result.tco_per_km,
+        comparison_tco_per_km=comparison_result.tco_per_km,
+        base_annual_operating_cost=base_result.annual_operating_cost,
+        comparison_annual_operating_cost=comparison_result.annual_operating_cost,
+    )
 
 
 def _create_modified_request(
@@ -349,64 +365,69 @@ def _create_modified_request(
     """
     Create a modified calculation request with the specified parameter changed.
     
-    This function creates a deep copy of the original request and modifies
-    the relevant parameter based on the parameter name.
+    Only the part of the request the swept parameter touches is copied; the
+    remaining tables are shared with *original_request*, which the TCO
+    service only reads.
     """
-    # Deep copy all dataframes and parameters
-    modified_request = CalculationRequest(
-        vehicle_data=original_request.vehicle_data.copy(),
-        fees_data=original_request.fees_data.copy(),
-        parameters=deepcopy(original_request.parameters),
-        charging_options=original_request.charging_options.copy(),
-        infrastructure_options=original_request.infrastructure_options.copy(),
-        financial_params=original_request.financial_params.copy(),
-        battery_params=original_request.battery_params.copy(),
-        emission_factors=original_request.emission_factors.copy(),
-        externalities_data=original_request.externalities_data.copy(),
-        incentives=original_request.incentives.copy(),
-    )
-    
+    parameters = original_request.parameters
+    financial_params = original_request.financial_params
+    charging_options = original_request.charging_options
+
     # Modify the appropriate parameter based on parameter_name
     if parameter_name == "Annual Distance (km)":
-        modified_request.parameters.annual_kms = int(parameter_value)
+        parameters = replace(parameters, annual_kms=int(parameter_value))
         
     elif parameter_name == "Diesel Price ($/L)":
         # Update diesel price in financial params
-        modified_request.financial_params.loc[
-            modified_request.financial_params[DataColumns.FINANCE_DESCRIPTION]
+        financial_params = financial_params.copy()
+        financial_params.loc[
+            financial_params[DataColumns.FINANCE_DESCRIPTION]
             == ParameterKeys.DIESEL_PRICE,
             DataColumns.FINANCE_DEFAULT_VALUE,
         ] = parameter_value
         
     elif parameter_name == "Vehicle Lifetime (years)":
-        modified_request.parameters.truck_life_years = int(parameter_value)
+        parameters = replace(parameters, truck_life_years=int(parameter_value))
         
     elif parameter_name == "Discount Rate (%)":
-        modified_request.parameters.discount_rate = parameter_value / 100
+        parameters = replace(parameters, discount_rate=parameter_value / 100)
         
     elif parameter_name == "Electricity Price ($/kWh)":
         # Get the base price for the selected charging option
-        selected_charging_id = original_request.parameters.selected_charging_profile_id
-        base_price = original_request.charging_options[
-            original_request.charging_options[DataColumns.CHARGING_ID] == selected_charging_id
+        selected_charging_id = parameters.selected_charging_profile_id
+        base_price = charging_options[
+            charging_options[DataColumns.CHARGING_ID] == selected_charging_id
         ].iloc[0][DataColumns.PER_KWH_PRICE]
         
-        # Update all charging options proportionally
-        for idx in modified_request.charging_options.index:
-            orig_price = original_request.charging_options.loc[idx, DataColumns.PER_KWH_PRICE]
-            price_ratio = safe_division(orig_price, base_price, context="electricity price ratio")
-            modified_request.charging_options.loc[idx, DataColumns.PER_KWH_PRICE] = (
-                parameter_value * price_ratio
-            )
+        # Scale all charging options proportionally in one column operation
+        scale = safe_division(
+            parameter_value, base_price, context="electricity price ratio"
+        )
+        charging_options = charging_options.copy()
+        charging_options[DataColumns.PER_KWH_PRICE] = (
+            charging_options[DataColumns.PER_KWH_PRICE] * scale
+        )
     
-    return modified_request
+    return replace(
+        original_request,
+        parameters=parameters,
+        financial_params=financial_params,
+        charging_options=charging_options,
+    )
+
+
+def _fees_row(fees: Union[pd.Series, pd.DataFrame]) -> pd.Series:
+    """Return the single fees row without rebuilding it when already a Series."""
+    if isinstance(fees, pd.Series):
+        return fees
+    return fees.iloc[0] if not fees.empty else pd.Series(dtype=object)
 
 
 def create_sensitivity_adapter(
     bev_vehicle_data: Union[pd.Series, dict],
     diesel_vehicle_data: Union[pd.Series, dict],
-    bev_fees: pd.DataFrame,
-    diesel_fees: pd.DataFrame,
+    bev_fees: Union[pd.Series, pd.DataFrame],
+    diesel_fees: Union[pd.Series, pd.DataFrame],
     charging_options: pd.DataFrame,
     infrastructure_options: pd.DataFrame,
     financial_params: pd.DataFrame,
@@ -440,9 +461,9 @@ def create_sensitivity_adapter(
     else:
         diesel_vehicle_series = diesel_vehicle_data
     
-    # Get fees data - assuming bev_fees and diesel_fees are DataFrames with one row
-    bev_fees_series = bev_fees.iloc[0] if not bev_fees.empty else pd.Series()
-    diesel_fees_series = diesel_fees.iloc[0] if not diesel_fees.empty else pd.Series()
+    # Fees arrive either as the repository's Series row or a one-row DataFrame
+    bev_fees_series = _fees_row(bev_fees)
+    diesel_fees_series = _fees_row(diesel_fees)
     
     # Create shared parameters
     parameters = CalculationParameters(
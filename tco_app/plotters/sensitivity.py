@@ -1,18 +1,25 @@
 import plotly.graph_objects as go
 
+from tco_app.src import np
 from tco_app.src.constants import ParameterKeys
 
 
-def create_sensitivity_chart(
-    bev_results, diesel_results, parameter, param_range, recalculated_tcos
-):
-    """Create a sensitivity analysis chart showing how TCO changes with parameter values."""
+def create_sensitivity_chart(bev_results, diesel_results, parameter, param_range, sweep):
+    """Create a sensitivity analysis chart showing how TCO changes with parameter values.
+
+    ``sweep`` is the ``VehiclePairResults`` of the recalculated points; its
+    ``(n, 2)`` lifetime TCO column is plotted as-is.
+    """
+    bev_tco = sweep.tco_lifetime[:, 0]
+    diesel_tco = sweep.tco_lifetime[:, 1]
+    difference = bev_tco - diesel_tco
+
     fig = go.Figure()
 
     fig.add_trace(
         go.Scatter(
             x=param_range,
-            y=[t["bev"]["tco_lifetime"] for t in recalculated_tcos],
+            y=bev_tco,
             mode="lines+markers",
             name="BEV TCO",
             line=dict(color="#2E86C1", width=3),
@@ -23,7 +30,7 @@ def create_sensitivity_chart(
     fig.add_trace(
         go.Scatter(
             x=param_range,
-            y=[t["diesel"]["tco_lifetime"] for t in recalculated_tcos],
+            y=diesel_tco,
             mode="lines+markers",
             name="Diesel TCO",
             line=dict(color="#E67E22", width=3),
@@ -34,10 +41,7 @@ def create_sensitivity_chart(
     fig.add_trace(
         go.Scatter(
             x=param_range,
-            y=[
-                t["bev"]["tco_lifetime"] - t["diesel"]["tco_lifetime"]
-                for t in recalculated_tcos
-            ],
+            y=difference,
             mode="lines+markers",
             name="TCO Difference (BEV - Diesel)",
             line=dict(color="#8E44AD", width=2, dash="dash"),
@@ -70,32 +74,18 @@ def create_sensitivity_chart(
             annotation_position="top right",
         )
 
+    # First adjacent pair whose difference changes sign (or touches zero)
     break_even_value = None
-    for i in range(len(param_range) - 1):
-        bev1, diesel1 = (
-            recalculated_tcos[i]["bev"]["tco_lifetime"],
-            recalculated_tcos[i]["diesel"]["tco_lifetime"],
-        )
-        bev2, diesel2 = (
-            recalculated_tcos[i + 1]["bev"]["tco_lifetime"],
-            recalculated_tcos[i + 1]["diesel"]["tco_lifetime"],
-        )
-        if (bev1 - diesel1) * (bev2 - diesel2) <= 0:
-            x1, x2 = param_range[i], param_range[i + 1]
-            y1, y2 = bev1 - diesel1, bev2 - diesel2
-            if y1 != y2:
-                break_even_value = x1 - y1 * (x2 - x1) / (y2 - y1)
-                break
+    y1, y2 = difference[:-1], difference[1:]
+    crossings = np.flatnonzero((y1 * y2 <= 0) & (y1 != y2))
+    if crossings.size:
+        i = crossings[0]
+        x1, x2 = param_range[i], param_range[i + 1]
+        break_even_value = x1 - y1[i] * (x2 - x1) / (y2[i] - y1[i])
 
     if break_even_value is not None:
-        bev_at_be = next(
-            (
-                b["bev"]["tco_lifetime"]
-                for b in recalculated_tcos
-                if b["bev"]["tco_lifetime"] - b["diesel"]["tco_lifetime"] == 0
-            ),
-            None,
-        )
+        exact = np.flatnonzero(difference == 0)
+        bev_at_be = bev_tco[exact[0]] if exact.size else None
         fig.add_trace(
             go.Scatter(
                 x=[break_even_value],
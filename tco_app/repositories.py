@@ -5,16 +5,27 @@ These repositories will provide an abstraction layer for accessing data,
 initially from in-memory DataFrames, but could be adapted for other sources.
 """
 
-from tco_app.src import Dict, pd
+from tco_app.src import Dict, Optional, pd
 from tco_app.src.exceptions import (
     VehicleNotFoundError,
 )  # Assuming this exception exists
 
 
+def _first_positions(df: pd.DataFrame, key_column: str) -> Dict[str, int]:
+    """Map each value of *key_column* to the row position of its first match."""
+    positions: Dict[str, int] = {}
+    for pos, key in enumerate(df[key_column].tolist()):
+        positions.setdefault(key, pos)
+    return positions
+
+
 class VehicleRepository:
     def __init__(self, data_tables: Dict[str, pd.DataFrame]):
         self.vehicle_models_df = data_tables.get("vehicle_models", pd.DataFrame())
         self.vehicle_fees_df = data_tables.get("vehicle_fees", pd.DataFrame())
+        # vehicle_id -> row position, built on first lookup
+        self._model_positions: Optional[Dict[str, int]] = None
+        self._fee_positions: Optional[Dict[str, int]] = None
 
     def get_vehicle_by_id(self, vehicle_id: str) -> pd.Series:
         """Retrieve a vehicle's specification data by its ID."""
@@ -26,14 +37,16 @@ class VehicleRepository:
                 "Vehicle models data is empty or 'vehicle_id' column is missing."
             )
 
-        vehicle_data = self.vehicle_models_df[
-            self.vehicle_models_df["vehicle_id"] == vehicle_id
-        ]
-        if vehicle_data.empty:
+        if self._model_positions is None:
+            self._model_positions = _first_positions(
+                self.vehicle_models_df, "vehicle_id"
+            )
+        pos = self._model_positions.get(vehicle_id)
+        if pos is None:
             raise VehicleNotFoundError(
                 f"Vehicle with ID '{vehicle_id}' not found in vehicle_models."
             )
-        return vehicle_data.iloc[0]
+        return self.vehicle_models_df.iloc[pos]
 
     def get_fees_by_vehicle_id(self, vehicle_id: str) -> pd.Series:
         """Retrieve a vehicle's fee data by its ID."""
@@ -44,13 +57,13 @@ class VehicleRepository:
             # Allow returning empty series if fees are optional or not always present for a vehicle
             return pd.Series(dtype=object)
 
-        fees_data = self.vehicle_fees_df[
-            self.vehicle_fees_df["vehicle_id"] == vehicle_id
-        ]
-        if fees_data.empty:
+        if self._fee_positions is None:
+            self._fee_positions = _first_positions(self.vehicle_fees_df, "vehicle_id")
+        pos = self._fee_positions.get(vehicle_id)
+        if pos is None:
             # Return empty series if no fees found for this specific vehicle
             return pd.Series(dtype=object)
-        return fees_data.iloc[0]
+        return self.vehicle_fees_df.iloc[pos]
 
 
 class ParametersRepository:
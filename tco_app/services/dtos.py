@@ -5,9 +5,9 @@ data for the TCO calculation service, promoting type safety and clear interfaces
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Sequence
 
-from tco_app.src import Any, datetime, pd
+from tco_app.src import Any, datetime, np, pd
 from tco_app.src.constants import DataColumns, Drivetrain
 
 __all__ = [
@@ -17,6 +17,7 @@ __all__ = [
     "ComparisonResult",
     "SensitivityRequest",
     "SensitivityResult",
+    "VehiclePairResults",
 ]
 
 
@@ -115,6 +116,11 @@ class TCOResult:
     )
     scenario_meta: Dict[str, str] = field(default_factory=dict)
 
+    # Request context carried for UI components
+    vehicle_data: Optional[pd.Series] = None
+    annual_kms: Optional[int] = None
+    truck_life_years: Optional[int] = None
+
 
 @dataclass
 class ComparisonResult:
@@ -151,7 +157,7 @@ class SensitivityRequest:
     """Request for sensitivity analysis on a specific parameter."""
     
     parameter_name: str
-    parameter_range: list[float]
+    parameter_range: Sequence[float]
     base_calculation_request: CalculationRequest
     comparison_calculation_request: CalculationRequest
     
@@ -174,3 +180,70 @@ class SensitivityResult:
     comparison_tco_per_km: Optional[float] = None
     base_annual_operating_cost: Optional[float] = None
     comparison_annual_operating_cost: Optional[float] = None
+
+
+# (VehiclePairResults field, TCOResult attribute) pairs copied into columns.
+_PAIR_METRICS = (
+    ("tco_lifetime", "tco_total_lifetime"),
+    ("tco_per_km", "tco_per_km"),
+    ("annual_operating_cost", "annual_operating_cost"),
+    ("energy_cost_per_km", "energy_cost_per_km"),
+    ("lifetime_emissions_co2e", "lifetime_emissions_co2e"),
+)
+
+
+@dataclass(slots=True)
+class VehiclePairResults:
+    """Column-oriented view of base versus comparison vehicle metrics.
+
+    Each metric is a float64 array whose last axis is ``(base, comparison)``:
+    shape ``(2,)`` for a single comparison and ``(n, 2)`` for an *n*-point
+    sensitivity sweep.
+    """
+
+    tco_lifetime: np.ndarray
+    tco_per_km: np.ndarray
+    annual_operating_cost: np.ndarray
+    energy_cost_per_km: np.ndarray
+    lifetime_emissions_co2e: np.ndarray
+    parameter_values: Optional[np.ndarray] = None
+
+    @classmethod
+    def from_results(
+        cls, base: TCOResult, comparison: TCOResult
+    ) -> "VehiclePairResults":
+        """Build a single-pair view from two TCO results."""
+        return cls(
+            **{
+                name: np.array(
+                    [getattr(base, attr), getattr(comparison, attr)], dtype=np.float64
+                )
+                for name, attr in _PAIR_METRICS
+            }
+        )
+
+    @classmethod
+    def from_sensitivity_results(
+        cls, results: Iterable[SensitivityResult]
+    ) -> "VehiclePairResults":
+        """Stack a sensitivity sweep into ``(n, 2)`` metric columns."""
+        results = list(results)
+        columns = {
+            name: np.array(
+                [
+                    (
+                        getattr(r.base_tco_result, attr),
+                        getattr(r.comparison_tco_result, attr),
+                    )
+                    for r in results
+                ],
+                dtype=np.float64,
+            ).reshape(len(results), 2)
+            for name, attr in _PAIR_METRICS
+        }
+        return cls(
+            **columns,
+            parameter_values=np.array(
+                [r.parameter_value for r in results], dtype=np.float64
+            ),
+        )
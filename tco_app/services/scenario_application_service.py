@@ -1,7 +1,8 @@
 """Service for applying scenario modifications to data."""
 
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Mapping
 
 from tco_app.src import logging, pd
 from tco_app.src.constants import DataColumns
@@ -27,47 +28,72 @@ class ModifierBase:
     def apply(self, table: pd.DataFrame, mod: ScenarioModification) -> None:
         raise NotImplementedError
 
+    def apply_many(
+        self, table: pd.DataFrame, mods: List[ScenarioModification]
+    ) -> None:
+        """Apply *mods* to *table* in order; handlers may vectorise this."""
+        for mod in mods:
+            self.apply(table, mod)
 
-class FinancialParamModifier(ModifierBase):
-    """Handler for financial parameter modifications."""
+
+class _KeyValueParamModifier(ModifierBase):
+    """Handler for description/value parameter tables.
+
+    All overrides for a table are resolved into one ``{description: value}``
+    map and written with a single masked assignment.
+    """
+
+    description_col: str
+    value_col: str
+    label: str
+    # Scenario parameter names accepted in place of a missing table description
+    aliases: ClassVar[Mapping[str, str]] = MappingProxyType({})
 
     def apply(self, table: pd.DataFrame, mod: ScenarioModification) -> None:
-        mask = table[DataColumns.FINANCE_DESCRIPTION] == mod.parameter_name
-        if mask.any():
-            table.loc[mask, DataColumns.FINANCE_DEFAULT_VALUE] = mod.parameter_value
-            logger.debug(
-                f"Applied financial parameter: {mod.parameter_name} = {mod.parameter_value}"
-            )
-        else:
-            if mod.parameter_name == "diesel_default_price":
-                mask = table[DataColumns.FINANCE_DESCRIPTION] == "diesel_price"
-                if mask.any():
-                    table.loc[mask, DataColumns.FINANCE_DEFAULT_VALUE] = (
-                        mod.parameter_value
-                    )
-                    logger.debug(
-                        f"Applied diesel_default_price to diesel_price: {mod.parameter_value}"
-                    )
-                else:
-                    logger.warning(
-                        "Financial parameter 'diesel_price' not found for diesel_default_price"
-                    )
+        self.apply_many(table, [mod])
+
+    def apply_many(
+        self, table: pd.DataFrame, mods: List[ScenarioModification]
+    ) -> None:
+        descriptions = table[self.description_col]
+        present = set(descriptions)
+        overrides: Dict[str, Any] = {}
+
+        for mod in mods:
+            name = mod.parameter_name
+            if name not in present and self.aliases.get(name) in present:
+                name = self.aliases[name]
+            if name in present:
+                # Later modifications of the same parameter win
+                overrides[name] = mod.parameter_value
+                logger.debug(
+                    f"Applied {self.label} parameter: {name} = {mod.parameter_value}"
+                )
             else:
-                logger.warning(f"Financial parameter '{mod.parameter_name}' not found")
+                logger.warning(
+                    f"{self.label.capitalize()} parameter '{mod.parameter_name}' not found"
+                )
 
+        if overrides:
+            mask = descriptions.isin(overrides.keys())
+            table.loc[mask, self.value_col] = descriptions[mask].map(overrides)
 
-class BatteryParamModifier(ModifierBase):
+
+class FinancialParamModifier(_KeyValueParamModifier):
+    """Handler for financial parameter modifications."""
+
+    description_col = DataColumns.FINANCE_DESCRIPTION
+    value_col = DataColumns.FINANCE_DEFAULT_VALUE
+    label = "financial"
+    aliases = MappingProxyType({"diesel_default_price": "diesel_price"})
+
+
+class BatteryParamModifier(_KeyValueParamModifier):
     """Handler for battery parameter modifications."""
 
-    def apply(self, table: pd.DataFrame, mod: ScenarioModification) -> None:
-        mask = table[DataColumns.BATTERY_DESCRIPTION] == mod.parameter_name
-        if mask.any():
-            table.loc[mask, DataColumns.BATTERY_DEFAULT_VALUE] = mod.parameter_value
-            logger.debug(
-                f"Applied battery parameter: {mod.parameter_name} = {mod.parameter_value}"
-            )
-        else:
-            logger.warning(f"Battery parameter '{mod.parameter_name}' not found")
+    description_col = DataColumns.BATTERY_DESCRIPTION
+    value_col = DataColumns.BATTERY_DEFAULT_VALUE
+    label = "battery"
 
 
 class VehicleModifier(ModifierBase):
@@ -163,19 +189,35 @@ class ScenarioApplicationService:
         Returns:
             List of modification objects
         """
-        modifications = []
-
-        for _, row in scenario_params.iterrows():
-            mod = ScenarioModification(
-                table_name=row["parameter_table"],
-                parameter_name=row["parameter_name"],
-                parameter_value=row["parameter_value"],
-                vehicle_type=row.get(DataColumns.VEHICLE_TYPE, "All"),
-                vehicle_drivetrain=row.get(DataColumns.VEHICLE_DRIVETRAIN, "All"),
+        n_rows = len(scenario_params)
+
+        def column(name: str, default: Any = None) -> List[Any]:
+            if name in scenario_params.columns:
+                return scenario_params[name].tolist()
+            return [default] * n_rows
+
+        return [
+            ScenarioModification(
+                table_name=table_name,
+                parameter_name=parameter_name,
+                parameter_value=parameter_value,
+                vehicle_type=vehicle_type,
+                vehicle_drivetrain=vehicle_drivetrain,
             )
-            modifications.append(mod)
-
-        return modifications
+            for (
+                table_name,
+                parameter_name,
+                parameter_value,
+                vehicle_type,
+                vehicle_drivetrain,
+            ) in zip(
+                column("parameter_table"),
+                column("parameter_name"),
+                column("parameter_value"),
+                column(DataColumns.VEHICLE_TYPE, "All"),
+                column(DataColumns.VEHICLE_DRIVETRAIN, "All"),
+            )
+        ]
 
     def apply_modifications(
         self,
@@ -193,24 +235,28 @@ class ScenarioApplicationService:
             target_drivetrain: Filter modifications by drivetrain
 
         Returns:
-            Modified data tables (copies)
+            New dict of data tables. Tables with applicable modifications are
+            modified copies; all others are the original objects and must be
+            treated as read-only.
         """
-        # Create deep copies
-        modified_tables = {name: df.copy() for name, df in data_tables.items()}
+        # Copy-on-write: tables are copied only when a handler modifies them
+        modified_tables = dict(data_tables)
 
+        # Group applicable modifications per table (order preserved) so each
+        # handler can apply its whole batch in one pass
+        pending: Dict[str, List[ScenarioModification]] = {}
         for mod in modifications:
-            # Check if modification applies
-            if not self._should_apply_modification(
+            if self._should_apply_modification(
                 mod, target_vehicle_type, target_drivetrain
             ):
-                continue
+                pending.setdefault(mod.table_name, []).append(mod)
 
-            # Apply modification
+        for table_name, mods in pending.items():
             try:
-                self._apply_single_modification(modified_tables, mod)
-                self.applied_modifications.append(mod)
+                self._apply_table_modifications(modified_tables, table_name, mods)
+                self.applied_modifications.extend(mods)
             except Exception as e:
-                logger.error(f"Failed to apply modification {mod}: {e}")
+                logger.error(f"Failed to apply modifications {mods}: {e}")
                 raise ScenarioError(
                     f"Failed to apply scenario modification: {str(e)}"
                 ) from e
@@ -233,19 +279,19 @@ class ScenarioApplicationService:
             target_drivetrain: Filter modifications by drivetrain
 
         Returns:
-            Modified data tables (copies)
+            New dict of data tables; see :meth:`apply_modifications`
         """
         scenario_params = data_tables.get("scenario_params")
         if scenario_params is None:
             logger.warning("No scenario_params table found")
-            return {name: df.copy() for name, df in data_tables.items()}
+            return dict(data_tables)
 
         # Filter scenario parameters by ID
         selected_params = scenario_params[scenario_params[DataColumns.SCENARIO_ID] == scenario_id]
 
         if selected_params.empty:
             logger.info(f"No parameters found for scenario {scenario_id}")
-            return {name: df.copy() for name, df in data_tables.items()}
+            return dict(data_tables)
 
         # Parse and apply modifications
         modifications = self.parse_scenario_params(selected_params)
@@ -278,19 +324,22 @@ class ScenarioApplicationService:
 
         return True
 
-    def _apply_single_modification(
-        self, tables: Dict[str, pd.DataFrame], mod: ScenarioModification
+    def _apply_table_modifications(
+        self,
+        tables: Dict[str, pd.DataFrame],
+        table_name: str,
+        mods: List[ScenarioModification],
     ) -> None:
-        """Apply a single modification to tables."""
-        if mod.table_name not in tables:
-            raise ScenarioError(f"Table '{mod.table_name}' not found in data tables")
+        """Apply all modifications targeting one table."""
+        if table_name not in tables:
+            raise ScenarioError(f"Table '{table_name}' not found in data tables")
 
-        table = tables[mod.table_name]
-        handler = self.handlers.get(mod.table_name)
+        handler = self.handlers.get(table_name)
         if handler:
-            handler.apply(table, mod)
+            tables[table_name] = tables[table_name].copy()
+            handler.apply_many(tables[table_name], mods)
         else:
-            logger.warning(f"No handler for table '{mod.table_name}'")
+            logger.warning(f"No handler for table '{table_name}'")
 
     def get_applied_modifications(self) -> List[ScenarioModification]:
         """Get list of modifications that were applied."""
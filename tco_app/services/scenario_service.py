@@ -24,16 +24,18 @@ def apply_scenario_parameters(
     vehicle_type: str,
     drivetrain: str,
 ) -> Dict[str, pd.DataFrame]:
-    """Return copies of parameter tables with scenario overrides applied.
+    """Return the data tables with scenario overrides applied.
 
-    Uses ScenarioApplicationService to apply modifications.
+    Uses ScenarioApplicationService to apply modifications. Only tables the
+    scenario modifies are copied; every other entry is the original object
+    from ``data_tables`` and must be treated as read-only.
     """
     scenario_params_df = data_tables.get("scenario_params")
     if scenario_params_df is None:
         warnings.warn("No scenario_params table found in data_tables.")
-        # Return copies of potentially modifiable tables to maintain original behaviour
+        # Return the potentially modifiable tables to maintain original behaviour
         return {
-            name: df.copy()
+            name: df
             for name, df in data_tables.items()
             if name
             in ["financial_params", "battery_params", "vehicle_models", "incentives"]
@@ -44,9 +46,9 @@ def apply_scenario_parameters(
     ]
 
     if selected_params_df.empty:
-        # Return copies of potentially modifiable tables
+        # Return the potentially modifiable tables
         return {
-            name: df.copy()
+            name: df
             for name, df in data_tables.items()
             if name
             in ["financial_params", "battery_params", "vehicle_models", "incentives"]
@@ -55,13 +57,13 @@ def apply_scenario_parameters(
     app_service = ScenarioApplicationService()
     modifications = app_service.parse_scenario_params(selected_params_df)
 
-    # Create copies of the tables that can be modified by scenarios
-    # to avoid altering the original data_tables dict passed in.
+    # The tables that can be modified by scenarios; apply_modifications copies
+    # a table before changing it, so the originals in data_tables are not altered.
     tables_to_modify = {
-        "financial_params": data_tables.get("financial_params", pd.DataFrame()).copy(),
-        "battery_params": data_tables.get("battery_params", pd.DataFrame()).copy(),
-        "vehicle_models": data_tables.get("vehicle_models", pd.DataFrame()).copy(),
-        "incentives": data_tables.get("incentives", pd.DataFrame()).copy(),
+        "financial_params": data_tables.get("financial_params", pd.DataFrame()),
+        "battery_params": data_tables.get("battery_params", pd.DataFrame()),
+        "vehicle_models": data_tables.get("vehicle_models", pd.DataFrame()),
+        "incentives": data_tables.get("incentives", pd.DataFrame()),
     }
 
     # Include other tables from data_tables, without copying if they are not modified
@@ -76,8 +78,10 @@ def apply_scenario_parameters(
         target_drivetrain=drivetrain,
     )
 
-    # Start with copies of all original tables
-    final_modified_tables = {name: df.copy() for name, df in data_tables.items()}
+    # Start with the remaining original tables, shared rather than copied
+    final_modified_tables = {
+        name: df for name, df in data_tables.items() if name not in modified_subset
+    }
     # Update with the (potentially) modified tables
     final_modified_tables.update(modified_subset)
 
@@ -17,7 +17,7 @@ from tco_app.services.dtos import CalculationRequest, ComparisonResult, TCOResul
 from tco_app.services.helpers import (
     get_residual_value_parameters,
 )
-from tco_app.src import Any, Dict, logging
+from tco_app.src import Any, Dict, Optional, logging
 from tco_app.src.constants import DataColumns, Drivetrain
 from tco_app.src.exceptions import CalculationError
 from tco_app.src.utils.battery import (
@@ -49,7 +49,7 @@ class TCOCalculationService:
         This method orchestrates calls to various domain modules (energy, finance, externalities)
         to compute different aspects of the TCO.
         """
-        logger.info(
+        logger.debug(
             f"Starting TCO calculation for vehicle: {request.vehicle_data.get(DataColumns.VEHICLE_ID, 'N/A')}"
         )
 
@@ -349,6 +349,9 @@ class TCOCalculationService:
             ],
             weighted_electricity_price=weighted_elec_price,
             scenario_meta={"name": request.parameters.scenario_name},
+            vehicle_data=request.vehicle_data,
+            annual_kms=request.parameters.annual_kms,
+            truck_life_years=request.parameters.truck_life_years,
         )
 
     def _calculate_tco_metrics(
@@ -376,6 +379,8 @@ class TCOCalculationService:
         self,
         base_vehicle_request: CalculationRequest,
         comparison_vehicle_request: CalculationRequest,
+        base_tco_result: Optional[TCOResult] = None,
+        comparison_tco_result: Optional[TCOResult] = None,
     ) -> ComparisonResult:
         """
         Compares TCO of two vehicles (e.g., a BEV vs. a Diesel).
@@ -383,15 +388,20 @@ class TCOCalculationService:
         Typically, base_vehicle_request would be for the new technology (e.g., BEV)
         and comparison_vehicle_request for the incumbent (e.g., Diesel).
         The savings are usually calculated as (Incumbent - New Tech).
+
+        Previously computed results for either request (e.g. served from a cache)
+        may be supplied to skip recalculating that vehicle.
         """
-        logger.info(
+        logger.debug(
             f"Starting TCO comparison between {base_vehicle_request.vehicle_data.get(DataColumns.VEHICLE_ID, 'Base')} and {comparison_vehicle_request.vehicle_data.get(DataColumns.VEHICLE_ID, 'Comparison')}"
         )
 
-        base_tco_result = self.calculate_single_vehicle_tco(base_vehicle_request)
-        comparison_tco_result = self.calculate_single_vehicle_tco(
-            comparison_vehicle_request
-        )
+        if base_tco_result is None:
+            base_tco_result = self.calculate_single_vehicle_tco(base_vehicle_request)
+        if comparison_tco_result is None:
+            comparison_tco_result = self.calculate_single_vehicle_tco(
+                comparison_vehicle_request
+            )
 
         # Calculate payload penalties if comparing BEV vs Diesel
         payload_penalties = None
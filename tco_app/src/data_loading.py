@@ -2,7 +2,8 @@ from __future__ import annotations
 
 import os
 from pathlib import Path
-from typing import Dict, List, Protocol
+from types import MappingProxyType
+from typing import List, Mapping, Protocol
 
 from tco_app.src import pd, st
 
@@ -62,8 +63,8 @@ def _default_repository() -> TableRepository:
 # --------------------------------------------------------------------------------------
 
 
-@st.cache_data
-def load_data(repo: TableRepository | None = None) -> Dict[str, pd.DataFrame]:
+@st.cache_resource
+def load_data(repo: TableRepository | None = None) -> Mapping[str, pd.DataFrame]:
     """Return all available tables as *DataFrame*s keyed by file stem.
 
     Parameters
@@ -72,7 +73,14 @@ def load_data(repo: TableRepository | None = None) -> Dict[str, pd.DataFrame]:
         Optional custom repository (e.g. *ParquetRepository* in future).  Falls
         back to a CSV repository rooted at *$TCO_DATA_DIR* or the historic
         `tco_app/data/tables` location.
+
+    The tables are cached as a shared resource: every session and page receives
+    the same DataFrame instances, so callers must copy before mutating (the
+    scenario and override paths already do). The mapping itself is a
+    read-only view so the shared table set cannot be altered by accident.
     """
 
     repository = repo or _default_repository()
-    return {name: repository.get(name) for name in repository.list_tables()}
+    return MappingProxyType(
+        {name: repository.get(name) for name in repository.list_tables()}
+    )
@@ -1,4 +1,9 @@
-"""Optimised calculation utilities."""
+"""Optimised calculation utilities.
+
+The Numba kernels are compiled with ``cache=True`` so the machine code is
+written next to this module (or to ``NUMBA_CACHE_DIR`` when set) and reused by
+later processes instead of being recompiled on every app start.
+"""
 
 from typing import Dict, List, Tuple
 
@@ -7,7 +12,7 @@ import numba
 from tco_app.src import np, pd
 
 
-@numba.jit(nopython=True)
+@numba.jit(nopython=True, cache=True)
 def fast_npv(cash_flows: np.ndarray, discount_rate: float) -> float:
     """Fast NPV calculation using Numba.
 
@@ -115,7 +120,7 @@ def batch_vehicle_lookup(
     return vehicle_models[mask]
 
 
-@numba.jit(nopython=True)
+@numba.jit(nopython=True, cache=True)
 def fast_discount_factors(discount_rate: float, years: int) -> np.ndarray:
     """Calculate discount factors using optimised computation.
 
@@ -186,7 +191,7 @@ def batch_parameter_lookup(
     return dict(zip(filtered_df[key_column], filtered_df[value_column]))
 
 
-@numba.jit(nopython=True)
+@numba.jit(nopython=True, cache=True)
 def fast_cumulative_sum(values: np.ndarray) -> np.ndarray:
     """Fast cumulative sum calculation.
 
@@ -1,12 +1,10 @@
 """Data access utilities for structured DataFrames."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from tco_app.src import pd
 from tco_app.src.constants import DataColumns, ParameterKeys
 
-from .pandas_helpers import get_parameter_value
-
 
 class ParametersRepository:
     """Repository pattern for accessing parameter DataFrames."""
@@ -23,6 +21,7 @@ class ParametersRepository:
         self.key_column = key_column
         self.value_column = value_column
         self._cache: Dict[str, Any] = {}
+        self._index: Optional[Dict[Any, Any]] = None
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get parameter value by key.
@@ -37,12 +36,18 @@ class ParametersRepository:
         if key in self._cache:
             return self._cache[key]
 
-        value = get_parameter_value(
-            self.df, self.key_column, key, self.value_column, default
-        )
+        if self._index is None:
+            self._index = self._build_index()
+        value = self._index.get(key, default)
         self._cache[key] = value
         return value
 
+    def _build_index(self) -> Dict[Any, Any]:
+        """Map every key to its value in one pass (first occurrence wins)."""
+        keys = self.df[self.key_column].tolist()
+        values = self.df[self.value_column].tolist()
+        return dict(zip(keys[::-1], values[::-1]))
+
 
 class FinancialParameters(ParametersRepository):
     """Specialised repository for financial parameters."""
@@ -8,11 +8,10 @@ charging-mix calculations.
 """
 
 import logging
-from typing import Dict, Mapping
+from typing import Iterable, Mapping, Tuple, Union
 
-from tco_app.src import pd
+from tco_app.src import np, pd
 from tco_app.src.constants import DataColumns
-from tco_app.src.utils.safe_operations import safe_division
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +25,9 @@ _EPS = 1e-12
 
 
 def weighted_electricity_price(
-    charging_mix: Mapping[int | str, float],
+    charging_mix: Union[
+        Mapping[int | str, float], Iterable[Tuple[int | str, float]]
+    ],
     charging_options: pd.DataFrame,
     *,
     id_column: str = DataColumns.CHARGING_ID,
@@ -37,7 +38,8 @@ def weighted_electricity_price(
     Parameters
     ----------
     charging_mix
-        Mapping of ``charging_id`` → proportion. Proportions can either be in
+        Mapping of ``charging_id`` → proportion, or an iterable of
+        ``(charging_id, proportion)`` pairs. Proportions can either be in
         decimal form (0-1) or percentage form (0-100). The function will
         automatically normalise the values, so they do **not** need to sum to
         unity/100.
@@ -46,41 +48,45 @@ def weighted_electricity_price(
     id_column, price_column
         Column names for the identifier and price respectively.
     """
-    logger.debug(f"weighted_electricity_price called with charging_mix: {charging_mix}")
-    logger.debug(
-        f"charging_mix type: {type(charging_mix)}, keys: {list(charging_mix.keys()) if charging_mix else 'None'}"
-    )
-
     if not charging_mix:
         return 0.0
 
+    pairs = tuple(
+        charging_mix.items() if isinstance(charging_mix, Mapping) else charging_mix
+    )
+    # An exhausted or empty iterator is truthy; treat it like an empty mapping
+    if not pairs:
+        return 0.0
+    charging_ids, proportions = zip(*pairs)
+    weights = np.asarray(proportions, dtype=float)
+
     # Determine whether the mix is expressed in percentages (>1) or fractions.
-    total = sum(charging_mix.values())
+    total = weights.sum()
     if total < _EPS:
         return 0.0
 
-    # Normalise to 1.0 regardless of original scale.
-    normalised_mix: Dict[int | str, float] = {
-        k: safe_division(v, total, context="v/total calculation")
-        for k, v in charging_mix.items()
-    }
-
-    # Map each id to its price.
-    prices = charging_options.set_index(id_column)[price_column]
-    logger.debug(f"Prices index: {prices.index.tolist()}")
-
-    weighted_price = 0.0
-    for cid, weight in normalised_mix.items():
-        logger.debug(f"Looking up charging ID: {cid} (type: {type(cid)})")
-        try:
-            price = float(prices.loc[cid])
-        except KeyError as exc:
-            logger.error(
-                f"Failed to find charging ID {cid} in prices. Available IDs: {prices.index.tolist()}"
-            )
-            raise KeyError(
-                f"Charging option with ID {cid!r} not found in charging_options table."
-            ) from exc
-        weighted_price += price * weight
+    # Map each id to its price with one dict built from plain lists.
+    price_lookup = dict(
+        zip(
+            charging_options[id_column].tolist(),
+            charging_options[price_column].tolist(),
+        )
+    )
+    try:
+        prices = np.fromiter(
+            (price_lookup[cid] for cid in charging_ids),
+            dtype=float,
+            count=len(charging_ids),
+        )
+    except KeyError as exc:
+        logger.error(
+            "Failed to find charging ID %r in prices. Available IDs: %s",
+            exc.args[0],
+            list(price_lookup),
+        )
+        raise KeyError(
+            f"Charging option with ID {exc.args[0]!r} not found in charging_options table."
+        ) from exc
 
-    return weighted_price
+    # Normalise to 1.0 regardless of original scale.
+    return float(np.dot(weights / total, prices))
@@ -7,6 +7,10 @@ anywhere in the codebase without side-effects.
 
 Functions
 ---------
+discount_factors(discount_rate, years)
+    End-of-year discount factors ``1 / (1 + r) ** t`` for ``t = 1..years``.
+    Memoised so BEV, diesel and externality NPVs share one vector.
+
 npv_constant(annual_cost, discount_rate, years)
     Net present value of a constant annual cash-flow occurring at the end of
     each period.
@@ -26,12 +30,15 @@ calculate_residual_value(vehicle_data, years, initial_depreciation, annual_depre
 
 from __future__ import annotations
 
-from math import inf
-from typing import Any, Iterable, List, Sequence
+from functools import lru_cache
+from math import fsum, inf
+from typing import Any, Iterable, List, Sequence, Tuple
 
+from tco_app.src.config import PERFORMANCE_CONFIG
 from tco_app.src.constants import DataColumns
 
 __all__ = [
+    "discount_factors",
     "npv_constant",
     "cumulative_cost_curve",
     "price_parity_year",
@@ -39,6 +46,25 @@ __all__ = [
 ]
 
 
+@lru_cache(maxsize=PERFORMANCE_CONFIG.LRU_CACHE_SIZE)
+def discount_factors(discount_rate: float, years: int) -> Tuple[float, ...]:
+    """Return end-of-year discount factors for years ``1..years``.
+
+    The result is an immutable tuple so it can be cached and shared between
+    callers; wrap it with ``np.asarray`` where a vector dot product is wanted.
+    """
+    if years <= 0:
+        return ()
+    base = 1.0 + discount_rate
+    return tuple(1.0 / base**year for year in range(1, years + 1))
+
+
+@lru_cache(maxsize=PERFORMANCE_CONFIG.LRU_CACHE_SIZE)
+def _annuity_factor(discount_rate: float, years: int) -> float:
+    """Sum of :func:`discount_factors`, i.e. the NPV of 1 paid each year."""
+    return fsum(discount_factors(discount_rate, years))
+
+
 def npv_constant(
     annual_cost: float, discount_rate: float, years: int
 ) -> float:  # noqa: D401
@@ -61,10 +87,7 @@ def npv_constant(
     if discount_rate == 0:  # Avoid division by zero; simple multiplication suffices
         return annual_cost * years
 
-    npv = 0.0
-    for year in range(1, years + 1):
-        npv += annual_cost / ((1 + discount_rate) ** year)
-    return npv
+    return annual_cost * _annuity_factor(discount_rate, years)
 
 
 def cumulative_cost_curve(
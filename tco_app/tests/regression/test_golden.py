@@ -10,6 +10,7 @@ from tco_app.src.utils.energy import weighted_electricity_price
 from tco_app.src.utils.finance import (
     calculate_residual_value,
     cumulative_cost_curve,
+    discount_factors,
     npv_constant,
     price_parity_year,
 )
@@ -45,8 +46,18 @@ def test_npv_constant_golden(annual: float, rate: float, years: int):
     assert math.isclose(npv_constant(annual, rate, years), expected, rel_tol=1e-9)
 
 
+@pytest.mark.parametrize("annual,rate,years", NPV_CASES)
+def test_discount_factors_match_npv(annual: float, rate: float, years: int):
+    """Shared discount factors must reproduce the constant-annuity NPV."""
+    factors = discount_factors(rate, years)
+    assert len(factors) == max(years, 0)
+    assert math.isclose(
+        sum(annual * f for f in factors), npv_constant(annual, rate, years), rel_tol=1e-9
+    )
+
+
 # ---------------------------------------------------------------------------
-# Weighted electricity price – 3 scenarios
+# Weighted electricity price – 4 scenarios
 # ---------------------------------------------------------------------------
 
 
@@ -78,6 +89,16 @@ def test_npv_constant_golden(annual: float, rate: float, years: int):
             pd.DataFrame([{"charging_id": "X", "per_kwh_price": 0.35}]),
             0.35,
         ),
+        (
+            (("A", 25), ("B", 75)),
+            pd.DataFrame(
+                [
+                    {"charging_id": "A", "per_kwh_price": 0.20},
+                    {"charging_id": "B", "per_kwh_price": 0.40},
+                ]
+            ),
+            0.20 * 0.25 + 0.40 * 0.75,
+        ),
     ],
 )
 def test_weighted_electricity_price_golden(mix, prices, expected):
@@ -86,6 +107,12 @@ def test_weighted_electricity_price_golden(mix, prices, expected):
     )
 
 
+@pytest.mark.parametrize("mix", [{}, (), iter(())], ids=["mapping", "tuple", "iterator"])
+def test_weighted_electricity_price_empty_mix(mix):
+    prices = pd.DataFrame([{"charging_id": "A", "per_kwh_price": 0.20}])
+    assert weighted_electricity_price(mix, prices) == 0.0
+
+
 # ---------------------------------------------------------------------------
 # Price parity year – synthetic curves (2 cases)
 # ---------------------------------------------------------------------------
@@ -0,0 +1,61 @@
+"""Test the columnar VehiclePairResults DTO."""
+
+import pytest
+
+from tco_app.services.dtos import SensitivityResult, TCOResult, VehiclePairResults
+from tco_app.src import np
+
+
+def _result(vehicle_id: str, tco: float) -> TCOResult:
+    return TCOResult(
+        vehicle_id=vehicle_id,
+        tco_total_lifetime=tco,
+        tco_per_km=tco / 1_000_000,
+        tco_per_tonne_km=0.05,
+        social_tco_total_lifetime=tco,
+        acquisition_cost=100_000,
+        residual_value=10_000,
+        npv_annual_operating_cost=tco / 2,
+        npv_battery_replacement_cost=0,
+        npv_infrastructure_cost=0,
+        annual_operating_cost=tco / 10,
+        energy_cost_per_km=0.3,
+        lifetime_emissions_co2e=5_000,
+        annual_emissions_co2e=500,
+        co2e_per_km=0.5,
+    )
+
+
+class TestVehiclePairResults:
+    """Test building the structure-of-arrays view."""
+
+    def test_from_results_pairs_base_and_comparison(self):
+        pair = VehiclePairResults.from_results(
+            _result("BEV001", 750_000), _result("DSL001", 850_000)
+        )
+        assert pair.tco_lifetime.shape == (2,)
+        assert pair.tco_lifetime.dtype == np.float64
+        np.testing.assert_allclose(pair.tco_lifetime, [750_000, 850_000])
+        assert pair.parameter_values is None
+
+    def test_from_sensitivity_results_stacks_sweep(self):
+        results = [
+            SensitivityResult(
+                parameter_value=value,
+                base_tco_result=_result("BEV001", 700_000 + value),
+                comparison_tco_result=_result("DSL001", 800_000 + value),
+                tco_difference=100_000,
+                percentage_difference=12.5,
+            )
+            for value in (0.0, 10.0, 20.0)
+        ]
+        sweep = VehiclePairResults.from_sensitivity_results(results)
+
+        assert sweep.tco_lifetime.shape == (3, 2)
+        np.testing.assert_allclose(sweep.parameter_values, [0.0, 10.0, 20.0])
+        assert sweep.tco_lifetime[2, 0] == pytest.approx(700_020)
+        assert sweep.tco_lifetime[2, 1] == pytest.approx(800_020)
+
+    def test_empty_sweep(self):
+        sweep = VehiclePairResults.from_sensitivity_results([])
+        assert sweep.tco_per_km.shape == (0, 2)
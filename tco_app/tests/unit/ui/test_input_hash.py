@@ -0,0 +1,37 @@
+"""Test the sidebar input fingerprints used as cache keys."""
+
+from tco_app.ui.context.input_hash import generate_input_hash, generate_stage_hashes
+
+
+class TestGenerateInputHash:
+    """Test the context fingerprint."""
+
+    def test_stable_for_equal_inputs(self):
+        inputs = {"annual_kms": 100_000, "charging_mix": {2: 40, 1: 60}}
+        same = {"charging_mix": {1: 60, 2: 40}, "annual_kms": 100_000}
+        assert generate_input_hash(inputs) == generate_input_hash(same)
+
+    def test_distinguishes_builtin_hash_collisions(self):
+        # hash(-1) == hash(-2) in CPython; the digest must still differ
+        assert generate_input_hash({"annual_kms": -1}) != generate_input_hash(
+            {"annual_kms": -2}
+        )
+
+
+class TestGenerateStageHashes:
+    """Test the per-stage fingerprints."""
+
+    def test_diesel_stage_ignores_bev_only_inputs(self):
+        base = {"comparison_diesel_id": "DSL001", "apply_incentives": True}
+        toggled = {**base, "apply_incentives": False}
+        assert (
+            generate_stage_hashes(base)["diesel"]
+            == generate_stage_hashes(toggled)["diesel"]
+        )
+        assert generate_stage_hashes(base)["bev"] != generate_stage_hashes(toggled)["bev"]
+
+    def test_vehicle_stages_distinguish_builtin_hash_collisions(self):
+        low = generate_stage_hashes({"annual_kms": -1})
+        high = generate_stage_hashes({"annual_kms": -2})
+        assert low["bev"] != high["bev"]
+        assert low["diesel"] != high["diesel"]
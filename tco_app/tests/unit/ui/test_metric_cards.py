@@ -0,0 +1,11 @@
+"""Test the KPI card stylesheet injected with the metric grids."""
+
+from tco_app.ui.components.metric_cards import _card_styles
+
+
+def test_card_styles_cover_cards_and_grid():
+    styles = _card_styles()
+    assert styles.startswith("<style>") and styles.endswith("</style>")
+    assert ".metric-card" in styles
+    assert ".metric-grid" in styles
+    assert "--card-bg" in styles
@@ -85,7 +85,7 @@ def _smoke_render(module_path: str) -> None:
             "annual_costs": {},
         },
         "diesel_results": {"vehicle_data": {}, "tco": {}, "annual_costs": {}},
-        "comparison_metrics": {},
+        "comparison": None,
         "truck_life_years": 10,
         "bev_vehicle_data": {},
         "diesel_vehicle_data": {},
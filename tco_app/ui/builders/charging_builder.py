@@ -16,6 +16,7 @@ class ChargingConfigurationBuilder:
         self.charging_approach = None
         self.charging_mix = None
         self.selected_charging = None
+        self.charging_mix_valid = True
 
     def configure_charging(self) -> "ChargingConfigurationBuilder":
         """Handle charging configuration UI."""
@@ -32,6 +33,8 @@ class ChargingConfigurationBuilder:
 
         if use_charging_mix:
             self.charging_mix = self._configure_mixed_charging(charging_options)
+            # None signals an allocation that does not sum to the required total
+            self.charging_mix_valid = self.charging_mix is not None
             # Get the first charging ID as default for mixed charging
             self.selected_charging = (
                 charging_options.iloc[0][DataColumns.CHARGING_ID]
@@ -64,17 +67,17 @@ class ChargingConfigurationBuilder:
         total_percentage = 0
         default_pct = UI_CONFIG.CHARGING_MIX_TOTAL // len(charging_options)
 
-        for idx, option in charging_options.iterrows():
+        for option in charging_options.itertuples():
             pct = st.slider(
-                f"{option[DataColumns.CHARGING_APPROACH]} (${option[DataColumns.PER_KWH_PRICE]:.2f}/kWh)",
+                f"{option.charging_approach} (${option.per_kwh_price:.2f}/kWh)",
                 0,
                 UI_CONFIG.CHARGING_MIX_TOTAL,
                 default_pct,
                 UI_CONFIG.CHARGING_MIX_STEP,
-                key=f"cm_{idx}",
-                help=f"Percentage of charging using {option[DataColumns.CHARGING_APPROACH]}"
+                key=f"cm_{option.Index}",
+                help=f"Percentage of charging using {option.charging_approach}"
             )
-            charging_percentages[option[DataColumns.CHARGING_ID]] = (
+            charging_percentages[option.charging_id] = (
                 pct / UI_CONFIG.CHARGING_MIX_TOTAL
             )
             total_percentage += pct
@@ -90,15 +93,24 @@ class ChargingConfigurationBuilder:
 
     def _configure_single_charging(self, charging_options: pd.DataFrame) -> int:
         """Configure single charging option."""
+        charging_ids = charging_options[DataColumns.CHARGING_ID].tolist()
+        # Format each label once; reversed so the first row wins on duplicate IDs
+        label_map = {
+            charging_id: f"{approach} (${price:.2f}/kWh)"
+            for charging_id, approach, price in reversed(
+                list(
+                    zip(
+                        charging_ids,
+                        charging_options[DataColumns.CHARGING_APPROACH].tolist(),
+                        charging_options[DataColumns.PER_KWH_PRICE].tolist(),
+                    )
+                )
+            )
+        }
         return st.selectbox(
             "Primary Charging Approach",
-            charging_options[DataColumns.CHARGING_ID].tolist(),
-            format_func=lambda x: charging_options[
-                charging_options[DataColumns.CHARGING_ID] == x
-            ]
-            .loc[:, [DataColumns.CHARGING_APPROACH, DataColumns.PER_KWH_PRICE]]
-            .apply(lambda r: f"{r.iloc[0]} (${r.iloc[1]:.2f}/kWh)", axis=1)
-            .iloc[0],
+            charging_ids,
+            format_func=label_map.__getitem__,
             key="primary_charging_selector",
             help="Select the primary method for charging your electric vehicle"
         )
@@ -109,6 +121,7 @@ class ChargingConfigurationBuilder:
             DataColumns.CHARGING_APPROACH: self.charging_approach,
             "charging_mix": self.charging_mix,
             "selected_charging": self.selected_charging,
+            "charging_mix_valid": self.charging_mix_valid,
         }
         logger.debug(f"ChargingConfigurationBuilder.build() returning: {result}")
         return result
@@ -18,26 +18,31 @@ class ScenarioBuilder:
         scenarios = self.data_tables["scenarios"]
         scenario_params = self.data_tables["scenario_params"]
 
+        # Resolve names/descriptions once instead of masking per option
+        scenario_ids = scenarios["scenario_id"].tolist()
+        scenario_names = dict(zip(scenario_ids, scenarios["scenario_name"].tolist()))
+        scenario_descriptions = dict(
+            zip(scenario_ids, scenarios["scenario_description"].tolist())
+        )
+
         self.scenario_id = st.selectbox(
             "Select Scenario",
-            scenarios["scenario_id"].tolist(),
-            format_func=lambda x: scenarios[scenarios["scenario_id"] == x].iloc[0][
-                "scenario_name"
-            ],
+            scenario_ids,
+            format_func=scenario_names.__getitem__,
             key="scenario_selector",
             help="Pre-configured scenarios automatically adjust relevant parameters"
         )
 
         # Get scenario details
-        scenario_row = scenarios[scenarios["scenario_id"] == self.scenario_id].iloc[0]
+        scenario_description = scenario_descriptions[self.scenario_id]
 
-        st.markdown(f'*{scenario_row["scenario_description"]}*')
+        st.markdown(f'*{scenario_description}*')
 
         # Store scenario metadata
         self.scenario_meta = {
             "id": self.scenario_id,
-            "name": scenario_row["scenario_name"],
-            "description": scenario_row["scenario_description"],
+            "name": scenario_names[self.scenario_id],
+            "description": scenario_description,
         }
 
         # Show scenario parameter overrides
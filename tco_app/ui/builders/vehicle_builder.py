@@ -32,26 +32,27 @@ class VehicleSelectionBuilder:
             type_vehicles[DataColumns.VEHICLE_DRIVETRAIN] == Drivetrain.BEV
         ]
 
+        # Index once so the selectbox and pair lookups are O(1) per access
+        vm_by_id = vehicle_models.drop_duplicates(DataColumns.VEHICLE_ID).set_index(
+            DataColumns.VEHICLE_ID, drop=False
+        )
+        model_names = vm_by_id[DataColumns.VEHICLE_MODEL].to_dict()
+
         self.selected_bev_id = st.selectbox(
             "Select BEV Model",
             bev_vehicles[DataColumns.VEHICLE_ID].tolist(),
-            format_func=lambda x: vehicle_models[
-                vehicle_models[DataColumns.VEHICLE_ID] == x
-            ].iloc[0][DataColumns.VEHICLE_MODEL],
+            format_func=model_names.__getitem__,
             key="bev_model_selector",
             help="Choose the battery electric vehicle for comparison"
         )
 
         # Get comparison diesel
-        selected_bev = vehicle_models[
-            vehicle_models[DataColumns.VEHICLE_ID] == self.selected_bev_id
-        ].iloc[0]
-        self.comparison_diesel_id = selected_bev[DataColumns.COMPARISON_PAIR_ID]
+        self.comparison_diesel_id = vm_by_id.at[
+            self.selected_bev_id, DataColumns.COMPARISON_PAIR_ID
+        ]
 
         # Show diesel info with better formatting
-        diesel_model = vehicle_models[
-            vehicle_models[DataColumns.VEHICLE_ID] == self.comparison_diesel_id
-        ].iloc[0][DataColumns.VEHICLE_MODEL]
+        diesel_model = model_names[self.comparison_diesel_id]
         st.info(f"**Comparison Diesel:** {diesel_model}")
 
         return self
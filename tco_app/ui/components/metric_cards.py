@@ -1,133 +1,245 @@
-from tco_app.src import st, UNIT_CONVERSIONS, VALIDATION_LIMITS
+from pathlib import Path
+
+from tco_app.src import (
+    PERFORMANCE_CONFIG,
+    UNIT_CONVERSIONS,
+    VALIDATION_LIMITS,
+    lru_cache,
+    st,
+)
 from tco_app.src.utils.pandas_helpers import to_scalar
 
+# Value format per unit; any unit mentioning CO₂ uses _CO2_FMT, others _DEFAULT_FMT
+_FMT = {"years": "{:.1f}", "%": "{:.2f}", "": "{:.2f}"}
+_CO2_FMT = "{:.1f}"
+_DEFAULT_FMT = "{:,.0f}"
 
-def display_metric_card(title, value, unit, tooltip=None, metric_type=None):
+
+def _value_formatter(unit):
+    """Return the bound ``str.format`` used to render values in *unit*."""
+    return (_FMT.get(unit) or (_CO2_FMT if "CO₂" in unit else _DEFAULT_FMT)).format
+
+# One card of the KPI grid; class styling lives in assets/metric_cards.css
+_CARD_TEMPLATE = (
+    '<div class="{cls}" title="{tooltip}">'
+    '<div class="metric-label">{title}</div>'
+    '<div class="metric-value">{value}</div>'
+    '<div class="metric-unit">{unit}</div>'
+    "</div>"
+)
+
+# Self-contained card stylesheet: the tokens and rules the cards need, nothing
+# that restyles the rest of the app
+_STYLESHEET = Path(__file__).resolve().parent.parent.parent / "assets" / "metric_cards.css"
+
+
+@st.cache_resource(show_spinner=False)
+def _card_styles():
+    """Return ``assets/metric_cards.css`` as a ``<style>`` block.
+
+    Read once per process; every session shares the same string.
     """
-    Display a metric in a formatted card with improved styling
+    return f"<style>{_STYLESHEET.read_text(encoding='utf-8')}</style>"
+
+
+def _inject_card_styles():
+    """Send the card styles for this run.
+
+    Style-only HTML goes to Streamlit's event container, so it takes no space
+    in the layout. Streamlit drops elements a run does not send again, so this
+    is called once per run that shows cards, not once per grid.
     """
-    val = to_scalar(value)
+    st.html(_card_styles())
+
+
+def _abatement_metric_type(abatement_cost):
+    """Classify an abatement cost against the validation thresholds."""
+    if abatement_cost < VALIDATION_LIMITS.ABATEMENT_COST_LOW_THRESHOLD:
+        return "positive"
+    if abatement_cost > VALIDATION_LIMITS.ABATEMENT_COST_HIGH_THRESHOLD:
+        return "negative"
+    return None
+
+
+# (title, ComparisonResult attribute, unit, tooltip, metric_type, transform);
+# metric_type may be a callable of the transformed value
+_METRIC_CARDS = (
+    (
+        "Upfront Cost Difference",
+        "upfront_cost_difference",
+        "AUD",
+        "Additional initial investment for electric vehicle",
+        "negative",
+        None,
+    ),
+    (
+        "Annual Operating Savings",
+        "annual_operating_cost_savings",
+        "AUD/year",
+        "Yearly savings in fuel and maintenance costs",
+        "positive",
+        None,
+    ),
+    (
+        "Price Parity Year",
+        "payback_period_years",
+        "years",
+        "First year when BEV lifetime cost equals diesel",
+        None,
+        None,
+    ),
+    (
+        "Lifetime CO₂ Reduction",
+        "emissions_reduction_lifetime_co2e",
+        "tonnes CO₂",
+        "Total emissions avoided over vehicle lifetime",
+        "positive",
+        lambda kg: kg / UNIT_CONVERSIONS.KG_TO_TONNES,
+    ),
+    (
+        "Total Cost Savings",
+        "bev_to_diesel_tco_ratio",
+        "%",
+        "Percentage reduction in total cost of ownership",
+        lambda pct: "positive" if pct > 0 else None,
+        lambda ratio: max(0.0, (1 - ratio) * 100),
+    ),
+    (
+        "Carbon Abatement Cost",
+        "abatement_cost",
+        "$/tonne CO₂",
+        "Cost effectiveness of emissions reduction",
+        _abatement_metric_type,
+        None,
+    ),
+)
+_FINANCIAL_CARDS = _METRIC_CARDS[:3]
+_ENVIRONMENTAL_CARDS = _METRIC_CARDS[3:]
+_METRIC_KEYS = tuple(card[1] for card in _METRIC_CARDS)
+_PARITY_YEAR_POS = _METRIC_KEYS.index("payback_period_years")
+
+# Formatters for the card units, resolved once at import
+_UNIT_FORMATTERS = {
+    unit: _value_formatter(unit)
+    for unit in (card[2] for card in _METRIC_CARDS)
+}
+
+
+def _metric_card_html(title, value, unit, tooltip=None, metric_type=None):
+    """Return the HTML for one metric card."""
+    # Plain numbers (the common case from DTO accessors) skip the coercion call
+    val = value if type(value) in (int, float) else to_scalar(value)
 
     # Format the value based on unit type
-    if unit == "years":
-        formatted_val = f"{val:.1f}"
-    elif unit == "%" or unit == "":
-        formatted_val = f"{val:.2f}"
-    elif "CO₂" in unit:
-        formatted_val = f"{val:.1f}"
-    else:
-        formatted_val = f"{val:,.0f}"
-
-    # Display the metric using Streamlit's metric component
-    delta_color = "normal"
-    if metric_type == "positive" and val > 0:
-        delta_color = "normal"
-    elif metric_type == "negative" and val < 0:
-        delta_color = "inverse"
-
-    st.metric(
-        label=title,
-        value=f"{formatted_val} {unit}",
-        delta=None,
-        delta_color=delta_color,
-        help=tooltip,
+    format_value = _UNIT_FORMATTERS.get(unit) or _value_formatter(unit)
+
+    return _CARD_TEMPLATE.format(
+        cls=f"metric-card {metric_type}" if metric_type else "metric-card",
+        tooltip=tooltip or "",
+        title=title,
+        value=format_value(val),
+        unit=unit,
     )
 
 
-def display_comparison_metrics(comparative_metrics):
+def _metric_grid_html(cards):
+    """Return the given card HTML strings wrapped in one grid element."""
+    return f'<div class="metric-grid">{"".join(cards)}</div>'
+
+
+def _render_metric_grid(cards):
+    """Render the given card HTML strings as one grid element."""
+    st.markdown(_metric_grid_html(cards), unsafe_allow_html=True)
+
+
+def display_metric_card(title, value, unit, tooltip=None, metric_type=None):
     """
-    Display the comparative metrics with improved visual hierarchy
+    Display a metric in a formatted card with improved styling
     """
-    st.markdown("## Key Performance Indicators")
+    _inject_card_styles()
+    _render_metric_grid([_metric_card_html(title, value, unit, tooltip, metric_type)])
+
+
+def _resolve_cards(cards, comparative_metrics):
+    """Return the (title, value, unit, tooltip, metric_type) rows for *cards*."""
+    rows = []
+    for title, key, unit, tooltip, metric_type, transform in cards:
+        value = comparative_metrics[key]
+        if transform is not None:
+            value = transform(value)
+        if callable(metric_type):
+            metric_type = metric_type(value)
+        rows.append((title, value, unit, tooltip, metric_type))
+    return tuple(rows)
+
+
+@lru_cache(maxsize=PERFORMANCE_CONFIG.LRU_CACHE_SIZE)
+def _comparison_cards(values):
+    """Resolve and render both KPI sections for metric *values*.
+
+    *values* follows ``_METRIC_KEYS`` order. Returns the financial and
+    environmental rows and their grid HTML; everything returned is immutable,
+    so cache hits can be shared between reruns.
+    """
+    comparative_metrics = dict(zip(_METRIC_KEYS, values))
+    parity_year = comparative_metrics["payback_period_years"]
+    # The parity card is last and is dropped when parity is out of reach
+    financial_cards = (
+        _FINANCIAL_CARDS
+        if parity_year < VALIDATION_LIMITS.MAX_REASONABLE_PARITY_YEARS
+        else _FINANCIAL_CARDS[:-1]
+    )
+    financial_rows = _resolve_cards(financial_cards, comparative_metrics)
+    environmental_rows = _resolve_cards(_ENVIRONMENTAL_CARDS, comparative_metrics)
+    return (
+        financial_rows,
+        environmental_rows,
+        _metric_grid_html([_metric_card_html(*row) for row in financial_rows]),
+        _metric_grid_html([_metric_card_html(*row) for row in environmental_rows]),
+    )
 
-    # Financial metrics section
-    st.markdown("### 💰 Financial Comparison")
 
-    col1, col2, col3 = st.columns(3)
+def display_comparison_metrics(comparison):
+    """
+    Display the comparative metrics of a ComparisonResult with improved visual hierarchy
+    """
+    # Plain numbers key the cache directly; anything else is coerced first
+    values = tuple(
+        value if type(value) in (int, float) else to_scalar(value)
+        for value in (getattr(comparison, attr) for attr in _METRIC_KEYS)
+    )
+    financial_rows, environmental, financial_html, environmental_html = (
+        _comparison_cards(values)
+    )
+    parity_year = values[_PARITY_YEAR_POS]
 
-    with col1:
-        display_metric_card(
-            "Upfront Cost Difference",
-            comparative_metrics["upfront_cost_difference"],
-            "AUD",
-            "Additional initial investment for electric vehicle",
-            metric_type="negative",
-        )
+    _inject_card_styles()
+    st.markdown("## Key Performance Indicators")
 
-    with col2:
-        display_metric_card(
-            "Annual Operating Savings",
-            comparative_metrics["annual_operating_savings"],
-            "AUD/year",
-            "Yearly savings in fuel and maintenance costs",
-            metric_type="positive",
-        )
+    # Financial metrics section
+    st.markdown("### 💰 Financial Comparison")
+    st.markdown(financial_html, unsafe_allow_html=True)
 
-    with col3:
-        if comparative_metrics["price_parity_year"] < VALIDATION_LIMITS.MAX_REASONABLE_PARITY_YEARS:
-            display_metric_card(
-                "Price Parity Year",
-                comparative_metrics["price_parity_year"],
-                "years",
-                "First year when BEV lifetime cost equals diesel",
-            )
-
-    # Payback period insight
-    if comparative_metrics["price_parity_year"] < 100:
-        payback_years = comparative_metrics["price_parity_year"]
-        upfront_diff = comparative_metrics["upfront_cost_difference"]
-        annual_savings = comparative_metrics["annual_operating_savings"]
+    # Payback period insight, reusing the values already resolved for the cards
+    if parity_year < 100:
+        upfront_diff = financial_rows[0][1]
+        annual_savings = financial_rows[1][1]
 
         # Use multiple info boxes to avoid the rendering bug with multiple formatted values
         st.markdown("**Investment Recovery Timeline**")
         st.info(f"💵 Upfront BEV Premium: ${upfront_diff:,.0f}")
         st.info(f"💰 Annual Operating Savings: ${annual_savings:,.0f}")
-        st.info(f"📅 Payback Period: {payback_years:.1f} years")
+        st.info(f"📅 Payback Period: {parity_year:.1f} years")
 
     # Environmental and efficiency metrics
     st.markdown("### 🌱 Environmental Impact")
-
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        display_metric_card(
-            "Lifetime CO₂ Reduction",
-            comparative_metrics["emission_savings_lifetime"] / UNIT_CONVERSIONS.KG_TO_TONNES,
-            "tonnes CO₂",
-            "Total emissions avoided over vehicle lifetime",
-            metric_type="positive",
-        )
-
-    with col2:
-        tco_ratio = comparative_metrics["bev_to_diesel_tco_ratio"]
-        percentage_savings = (1 - tco_ratio) * 100 if tco_ratio < 1 else 0
-
-        display_metric_card(
-            "Total Cost Savings",
-            percentage_savings,
-            "%",
-            "Percentage reduction in total cost of ownership",
-            metric_type="positive" if percentage_savings > 0 else None,
-        )
-
-    with col3:
-        abatement_cost = comparative_metrics["abatement_cost"]
-
-        display_metric_card(
-            "Carbon Abatement Cost",
-            abatement_cost,
-            "$/tonne CO₂",
-            "Cost effectiveness of emissions reduction",
-            metric_type=(
-                "positive"
-                if abatement_cost < VALIDATION_LIMITS.ABATEMENT_COST_LOW_THRESHOLD
-                else "negative" if abatement_cost > VALIDATION_LIMITS.ABATEMENT_COST_HIGH_THRESHOLD else None
-            ),
-        )
+    st.markdown(environmental_html, unsafe_allow_html=True)
 
     # Summary insight
+    tonnes_saved = environmental[0][1]
+    percentage_savings = environmental[1][1]
     if percentage_savings > 0:
         st.success(
             f"**Investment Summary:** {percentage_savings:.1f}% lower total cost of ownership "
-            f"while reducing {comparative_metrics['emission_savings_lifetime'] / UNIT_CONVERSIONS.KG_TO_TONNES:.1f} tonnes of CO₂"
+            f"while reducing {tonnes_saved:.1f} tonnes of CO₂"
         )
@@ -1,14 +1,16 @@
 """Components for sensitivity analysis page refactoring."""
 
+import operator
 from dataclasses import dataclass
-from typing import List, Any, Dict
+from typing import Any, Dict, Tuple, Union
+import numpy as np
 import pandas as pd
 
 from tco_app.src.constants import DataColumns, ParameterKeys
-from tco_app.src import VALIDATION_LIMITS, CALC_DEFAULTS
+from tco_app.src import VALIDATION_LIMITS, CALC_DEFAULTS, st
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SensitivityContext:
     """Encapsulates all context data for sensitivity analysis."""
 
@@ -16,13 +18,14 @@ class SensitivityContext:
     diesel_results: dict
     bev_vehicle_data: pd.DataFrame
     diesel_vehicle_data: pd.DataFrame
-    bev_fees: pd.DataFrame
-    diesel_fees: pd.DataFrame
+    bev_fees: Union[pd.Series, pd.DataFrame]
+    diesel_fees: Union[pd.Series, pd.DataFrame]
     charging_options: pd.DataFrame
     infrastructure_options: pd.DataFrame
     financial_params_with_ui: pd.DataFrame
     battery_params_with_ui: pd.DataFrame
     emission_factors: pd.DataFrame
+    externalities_data: pd.DataFrame
     incentives: pd.DataFrame
     selected_charging: int
     selected_infrastructure: int
@@ -36,16 +39,103 @@ class SensitivityContext:
     @classmethod
     def from_context(cls, ctx: dict) -> "SensitivityContext":
         """Create from context dictionary."""
-        fields_to_extract = cls.__dataclass_fields__.keys()
-        extracted_data = {}
+        missing = _CONTEXT_FIELD_SET - ctx.keys()
+        if missing:
+            missing_fields = ", ".join(f"'{name}'" for name in sorted(missing))
+            raise KeyError(f"Required field {missing_fields} not found in context")
 
-        for field in fields_to_extract:
-            if field in ctx:
-                extracted_data[field] = ctx[field]
-            else:
-                raise KeyError(f"Required field '{field}' not found in context")
+        return cls(*_get_context_fields(ctx))
 
-        return cls(**extracted_data)
+
+# Field names resolved once; ``from_context`` extracts them in a single call.
+_CONTEXT_FIELDS = tuple(SensitivityContext.__dataclass_fields__)
+_CONTEXT_FIELD_SET = frozenset(_CONTEXT_FIELDS)
+_get_context_fields = operator.itemgetter(*_CONTEXT_FIELDS)
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _finance_index(financial_params: pd.DataFrame) -> Dict[str, Any]:
+    """Map each financial parameter description to its (first) default value."""
+    return dict(
+        zip(
+            financial_params[DataColumns.FINANCE_DESCRIPTION].tolist()[::-1],
+            financial_params[DataColumns.FINANCE_DEFAULT_VALUE].tolist()[::-1],
+        )
+    )
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _charging_index(charging_options: pd.DataFrame) -> Dict[Any, Any]:
+    """Map each charging option ID to its (first) per-kWh price."""
+    return dict(
+        zip(
+            charging_options[DataColumns.CHARGING_ID].tolist()[::-1],
+            charging_options[DataColumns.PER_KWH_PRICE].tolist()[::-1],
+        )
+    )
+
+
+# --------------------------------------------------------------------------------------
+# Range builders – pure functions of scalar inputs, cached across reruns
+# --------------------------------------------------------------------------------------
+
+
+def _create_range(
+    min_val: float, max_val: float, base_value: float, round_digits: int, num_points: int
+) -> Tuple[float, ...]:
+    """Create parameter range with base value included."""
+    param_range = np.round(np.linspace(min_val, max_val, num_points), round_digits)
+    rounded_base = round(base_value, round_digits)
+    if rounded_base not in param_range:
+        idx = np.searchsorted(param_range, rounded_base)
+        param_range = np.insert(param_range, idx, rounded_base)
+    return tuple(param_range.tolist())
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _annual_distance_range(base_value: float, num_points: int) -> Tuple[float, ...]:
+    """Range for annual distance around *base_value*."""
+    min_val = max(VALIDATION_LIMITS.MIN_ANNUAL_KMS, base_value * VALIDATION_LIMITS.SENSITIVITY_MIN_FACTOR_STRICT)
+    max_val = base_value * (1 + VALIDATION_LIMITS.SENSITIVITY_VARIANCE_FACTOR)
+    return _create_range(min_val, max_val, base_value, 0, num_points)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _diesel_price_range(base_value: float, num_points: int) -> Tuple[float, ...]:
+    """Range for diesel price around *base_value*."""
+    min_val = max(VALIDATION_LIMITS.MIN_DIESEL_PRICE, base_value * VALIDATION_LIMITS.SENSITIVITY_MIN_FACTOR)
+    max_val = base_value * VALIDATION_LIMITS.SENSITIVITY_MAX_FACTOR
+    return _create_range(min_val, max_val, base_value, 2, num_points)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _electricity_price_range(base_value: float, num_points: int) -> Tuple[float, ...]:
+    """Range for electricity price around *base_value*."""
+    min_val = max(VALIDATION_LIMITS.MIN_ELECTRICITY_PRICE, base_value * VALIDATION_LIMITS.SENSITIVITY_MIN_FACTOR)
+    max_val = base_value * VALIDATION_LIMITS.SENSITIVITY_MAX_FACTOR
+    return _create_range(min_val, max_val, base_value, 2, num_points)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _vehicle_lifetime_range(base_value: int) -> Tuple[int, ...]:
+    """Whole-year lifetime range around *base_value*.
+
+    The UI enforces ``base_value >= MIN_TRUCK_LIFE_YEARS``, so the base value is
+    always inside ``[min_val, max_val]`` and needs no separate insertion.
+    """
+    base_value = int(base_value)
+    min_val = max(VALIDATION_LIMITS.MIN_TRUCK_LIFE_YEARS, base_value - VALIDATION_LIMITS.SENSITIVITY_LIFETIME_ADJUSTMENT)
+    max_val = base_value + VALIDATION_LIMITS.SENSITIVITY_LIFETIME_ADJUSTMENT
+    return tuple(range(min_val, max_val + 1))
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _discount_rate_range(base_value: float, num_points: int) -> Tuple[float, ...]:
+    """Discount-rate range (in percent) around the decimal *base_value*."""
+    discount_base = base_value * 100  # Convert to percentage
+    min_val = max(VALIDATION_LIMITS.MIN_DISCOUNT_RATE * 100, discount_base - VALIDATION_LIMITS.SENSITIVITY_DISCOUNT_ADJUSTMENT)
+    max_val = min(VALIDATION_LIMITS.MAX_DISCOUNT_RATE * 100, discount_base + VALIDATION_LIMITS.SENSITIVITY_DISCOUNT_ADJUSTMENT)
+    return _create_range(min_val, max_val, discount_base, 1, num_points)
 
 
 class ParameterRangeCalculator:
@@ -54,75 +144,50 @@ class ParameterRangeCalculator:
     def __init__(self, num_points: int = 11):
         self.num_points = num_points
 
-    def calculate_annual_distance_range(self, base_value: float) -> List[float]:
+    def calculate_annual_distance_range(self, base_value: float) -> Tuple[float, ...]:
         """Calculate range for annual distance parameter."""
-        min_val = max(VALIDATION_LIMITS.MIN_ANNUAL_KMS, base_value * VALIDATION_LIMITS.SENSITIVITY_MIN_FACTOR_STRICT)
-        max_val = base_value * (1 + VALIDATION_LIMITS.SENSITIVITY_VARIANCE_FACTOR)
-        return self._create_range(min_val, max_val, base_value, round_digits=0)
+        return _annual_distance_range(float(base_value), self.num_points)
 
     def calculate_diesel_price_range(
         self, financial_params: pd.DataFrame
-    ) -> List[float]:
+    ) -> Tuple[float, ...]:
         """Calculate range for diesel price parameter."""
         base_value = self._get_financial_param(
             financial_params, ParameterKeys.DIESEL_PRICE
         )
-        min_val = max(VALIDATION_LIMITS.MIN_DIESEL_PRICE, base_value * VALIDATION_LIMITS.SENSITIVITY_MIN_FACTOR)
-        max_val = base_value * VALIDATION_LIMITS.SENSITIVITY_MAX_FACTOR
-        return self._create_range(min_val, max_val, base_value, round_digits=2)
+        return _diesel_price_range(float(base_value), self.num_points)
 
     def calculate_electricity_price_range(
         self, bev_results: dict, charging_options: pd.DataFrame, selected_charging: int
-    ) -> List[float]:
+    ) -> Tuple[float, ...]:
         """Calculate range for electricity price parameter."""
         base_value = self._get_electricity_base_price(
             bev_results, charging_options, selected_charging
         )
-        min_val = max(VALIDATION_LIMITS.MIN_ELECTRICITY_PRICE, base_value * VALIDATION_LIMITS.SENSITIVITY_MIN_FACTOR)
-        max_val = base_value * VALIDATION_LIMITS.SENSITIVITY_MAX_FACTOR
-        return self._create_range(min_val, max_val, base_value, round_digits=2)
+        return _electricity_price_range(float(base_value), self.num_points)
 
-    def calculate_vehicle_lifetime_range(self, base_value: int) -> List[int]:
+    def calculate_vehicle_lifetime_range(self, base_value: int) -> Tuple[int, ...]:
         """Calculate range for vehicle lifetime parameter."""
-        min_val = max(VALIDATION_LIMITS.MIN_TRUCK_LIFE_YEARS, base_value - VALIDATION_LIMITS.SENSITIVITY_LIFETIME_ADJUSTMENT)
-        max_val = base_value + VALIDATION_LIMITS.SENSITIVITY_LIFETIME_ADJUSTMENT
-        param_range = list(range(int(min_val), int(max_val + 1)))
-        if base_value not in param_range:
-            param_range.append(base_value)
-            param_range.sort()
-        return param_range
-
-    def calculate_discount_rate_range(self, base_value: float) -> List[float]:
+        return _vehicle_lifetime_range(base_value)
+
+    def calculate_discount_rate_range(self, base_value: float) -> Tuple[float, ...]:
         """Calculate range for discount rate parameter."""
-        discount_base = base_value * 100  # Convert to percentage
-        min_val = max(VALIDATION_LIMITS.MIN_DISCOUNT_RATE * 100, discount_base - VALIDATION_LIMITS.SENSITIVITY_DISCOUNT_ADJUSTMENT)
-        max_val = min(VALIDATION_LIMITS.MAX_DISCOUNT_RATE * 100, discount_base + VALIDATION_LIMITS.SENSITIVITY_DISCOUNT_ADJUSTMENT)
-        return self._create_range(min_val, max_val, discount_base, round_digits=1)
+        return _discount_rate_range(float(base_value), self.num_points)
 
     def _create_range(
         self, min_val: float, max_val: float, base_value: float, round_digits: int
-    ) -> List[float]:
+    ) -> Tuple[float, ...]:
         """Create parameter range with base value included."""
-        step = (max_val - min_val) / (self.num_points - 1)
-        param_range = [
-            round(min_val + i * step, round_digits) for i in range(self.num_points)
-        ]
-        rounded_base = round(base_value, round_digits)
-        if rounded_base not in param_range:
-            param_range.append(rounded_base)
-            param_range.sort()
-        return param_range
+        return _create_range(min_val, max_val, base_value, round_digits, self.num_points)
 
     def _get_financial_param(
         self, financial_params: pd.DataFrame, param_key: str
     ) -> float:
         """Extract financial parameter value."""
-        param_row = financial_params[
-            financial_params[DataColumns.FINANCE_DESCRIPTION] == param_key
-        ]
-        if param_row.empty:
-            raise ValueError(f"Financial parameter '{param_key}' not found")
-        return param_row.iloc[0][DataColumns.FINANCE_DEFAULT_VALUE]
+        try:
+            return _finance_index(financial_params)[param_key]
+        except KeyError:
+            raise ValueError(f"Financial parameter '{param_key}' not found") from None
 
     def _get_electricity_base_price(
         self, bev_results: dict, charging_options: pd.DataFrame, selected_charging: int
@@ -136,15 +201,11 @@ class ParameterRangeCalculator:
                 return electricity_base
 
         try:
-            charging_row = charging_options[
-                charging_options[DataColumns.CHARGING_ID] == selected_charging
-            ]
-            if not charging_row.empty:
-                electricity_base = charging_row.iloc[0][DataColumns.PER_KWH_PRICE]
-                if electricity_base is not None and isinstance(
-                    electricity_base, (int, float)
-                ):
-                    return electricity_base
+            electricity_base = _charging_index(charging_options).get(selected_charging)
+            if electricity_base is not None and isinstance(
+                electricity_base, (int, float)
+            ):
+                return electricity_base
         except (IndexError, KeyError):
             pass
 
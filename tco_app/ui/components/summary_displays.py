@@ -1,4 +1,4 @@
-from tco_app.src import st
+from tco_app.src import Any, Tuple, st
 from tco_app.src.constants import DataColumns
 from tco_app.ui.utils.dto_accessors import (
     get_tco_lifetime,
@@ -9,6 +9,44 @@ from tco_app.ui.utils.dto_accessors import (
 )
 
 
+def _extract_vehicle_fields(results) -> Tuple[str, float, Any]:
+    """Return ``(name, payload_t, range_km)`` for a TCOResult DTO or legacy dict."""
+    if isinstance(results, dict):
+        vehicle_data = results.get("vehicle_data", {})
+        fallback_name = "Unknown"
+    else:
+        vehicle_data = getattr(results, "vehicle_data", None)
+        fallback_name = getattr(results, "vehicle_id", "Unknown")
+    if not hasattr(vehicle_data, "get"):
+        vehicle_data = {}
+
+    return (
+        vehicle_data.get(DataColumns.VEHICLE_MODEL, fallback_name),
+        vehicle_data.get(DataColumns.PAYLOAD_T, 0),
+        vehicle_data.get(DataColumns.RANGE_KM, "N/A"),
+    )
+
+
+def _vehicle_card_markdown(results, vehicle_type: str, tco_lifetime: float) -> str:
+    """Build one Markdown block for a vehicle column.
+
+    Lines end with two spaces to force hard line breaks, so the whole card is
+    sent to the frontend as a single element.
+    """
+    vehicle_name, payload, range_km = _extract_vehicle_fields(results)
+    range_str = range_km if range_km == "N/A" else f"{range_km:,.0f}"
+    return (
+        f"### {vehicle_name}\n\n"
+        f"**Vehicle Type:** {vehicle_type}  \n"
+        f"**Payload Capacity:** {payload:.1f} tonnes  \n"
+        f"**Range:** {range_str} km  \n"
+        f"**Lifetime TCO:** ${tco_lifetime:,.0f}  \n"
+        f"**Cost per km:** ${get_tco_per_km(results):.2f}  \n"
+        f"**Cost per tonne-km:** ${get_tco_per_tonne_km(results):.3f}  \n"
+        f"**Annual Operating Cost:** ${get_annual_operating_cost(results):,.0f}"
+    )
+
+
 def display_summary_metrics(bev_results, diesel_results):
     """
     Display summary metrics for both vehicles with improved visual hierarchy
@@ -39,74 +77,8 @@ def display_summary_metrics(bev_results, diesel_results):
 
     with col1:
         with st.container():
-            # Handle both DTO and dict cases for vehicle data access
-            if hasattr(bev_results, 'vehicle_id'):
-                # DTO case
-                vehicle_data = bev_results.vehicle_data if hasattr(bev_results, 'vehicle_data') else {}
-                # Get vehicle model name from vehicle_data
-                if hasattr(vehicle_data, 'get'):
-                    vehicle_name = vehicle_data.get(DataColumns.VEHICLE_MODEL, bev_results.vehicle_id)
-                else:
-                    vehicle_name = bev_results.vehicle_id
-            else:
-                # Dict case
-                vehicle_data = bev_results.get('vehicle_data', {})
-                vehicle_name = vehicle_data.get(DataColumns.VEHICLE_MODEL, 'Unknown')
-            
-            st.markdown(f"### {vehicle_name}")
-
-            # Vehicle details
-            st.markdown("**Vehicle Type:** Battery Electric")
-            
-            # Safe access to vehicle data fields
-            payload = vehicle_data.get(DataColumns.PAYLOAD_T, 0) if hasattr(vehicle_data, 'get') else 0
-            range_km = vehicle_data.get(DataColumns.RANGE_KM, 'N/A') if hasattr(vehicle_data, 'get') else 'N/A'
-            
-            st.markdown(f"**Payload Capacity:** {payload:.1f} tonnes")
-            st.markdown(f"**Range:** {range_km if range_km == 'N/A' else f'{range_km:,.0f}'} km")
-
-            # TCO metrics
-            st.markdown(f"**Lifetime TCO:** ${bev_npv:,.0f}")
-            bev_tco_km = get_tco_per_km(bev_results)
-            st.markdown(f"**Cost per km:** ${bev_tco_km:.2f}")
-            bev_tco_tkm = get_tco_per_tonne_km(bev_results)
-            st.markdown(f"**Cost per tonne-km:** ${bev_tco_tkm:.3f}")
-            bev_annual = get_annual_operating_cost(bev_results)
-            st.markdown(f"**Annual Operating Cost:** ${bev_annual:,.0f}")
+            st.markdown(_vehicle_card_markdown(bev_results, "Battery Electric", bev_npv))
 
     with col2:
         with st.container():
-            # Handle both DTO and dict cases for vehicle data access
-            if hasattr(diesel_results, 'vehicle_id'):
-                # DTO case
-                vehicle_data = diesel_results.vehicle_data if hasattr(diesel_results, 'vehicle_data') else {}
-                # Get vehicle model name from vehicle_data
-                if hasattr(vehicle_data, 'get'):
-                    vehicle_name = vehicle_data.get(DataColumns.VEHICLE_MODEL, diesel_results.vehicle_id)
-                else:
-                    vehicle_name = diesel_results.vehicle_id
-            else:
-                # Dict case
-                vehicle_data = diesel_results.get('vehicle_data', {})
-                vehicle_name = vehicle_data.get(DataColumns.VEHICLE_MODEL, 'Unknown')
-            
-            st.markdown(f"### {vehicle_name}")
-
-            # Vehicle details
-            st.markdown("**Vehicle Type:** Diesel")
-            
-            # Safe access to vehicle data fields
-            payload = vehicle_data.get(DataColumns.PAYLOAD_T, 0) if hasattr(vehicle_data, 'get') else 0
-            range_km = vehicle_data.get(DataColumns.RANGE_KM, 'N/A') if hasattr(vehicle_data, 'get') else 'N/A'
-            
-            st.markdown(f"**Payload Capacity:** {payload:.1f} tonnes")
-            st.markdown(f"**Range:** {range_km if range_km == 'N/A' else f'{range_km:,.0f}'} km")
-
-            # TCO metrics
-            st.markdown(f"**Lifetime TCO:** ${diesel_npv:,.0f}")
-            diesel_tco_km = get_tco_per_km(diesel_results)
-            st.markdown(f"**Cost per km:** ${diesel_tco_km:.2f}")
-            diesel_tco_tkm = get_tco_per_tonne_km(diesel_results)
-            st.markdown(f"**Cost per tonne-km:** ${diesel_tco_tkm:.3f}")
-            diesel_annual = get_annual_operating_cost(diesel_results)
-            st.markdown(f"**Annual Operating Cost:** ${diesel_annual:,.0f}")
+            st.markdown(_vehicle_card_markdown(diesel_results, "Diesel", diesel_npv))
@@ -2,10 +2,11 @@
 
 from .context import get_context
 from .context_builder import ContextDirector
-from .input_hash import generate_input_hash
+from .input_hash import generate_input_hash, generate_stage_hashes
 
 __all__ = [
     'get_context',
     'ContextDirector',
-    'generate_input_hash'
+    'generate_input_hash',
+    'generate_stage_hashes',
 ] 
\ No newline at end of file
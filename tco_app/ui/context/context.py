@@ -2,23 +2,85 @@
 
 This module provides a way to manage context throughout the UI components
 and pages, ensuring consistent data access and calculations.
+
+Results are cached per stage (see :mod:`tco_app.ui.context.input_hash` for
+the dependency graph): each vehicle's TCO is keyed on its own fingerprint and
+the assembled context on the full input hash.
 """
 
 from __future__ import annotations
 
-from tco_app.src import Any, Dict, logging, st
+from tco_app.src import PERFORMANCE_CONFIG, UI_CONFIG, Any, Dict, logging, st
 from tco_app.src.data_loading import load_data
-from tco_app.ui.orchestration import CalculationOrchestrator
 from tco_app.ui.context.context_builder import ContextDirector
 from tco_app.ui.renderers import SidebarRenderer
-from tco_app.ui.context.input_hash import generate_input_hash
+from tco_app.ui.context.input_hash import generate_input_hash, generate_stage_hashes
 
 logger = logging.getLogger(__name__)
 
 
+@st.cache_data(show_spinner=False, max_entries=PERFORMANCE_CONFIG.DEFAULT_CACHE_SIZE)
+def _compute_context(
+    input_hash: str,
+    _data_tables: Dict[str, Any],
+    _sidebar_inputs: Dict[str, Any],
+    _stage_hashes: Dict[str, str],
+) -> Dict[str, Any]:
+    """Build the UI context and run calculations for a given set of inputs.
+
+    Only ``input_hash`` forms the cache key (underscore-prefixed arguments are
+    not hashed by Streamlit), so identical sidebar selections are served from
+    the cache across reruns and sessions. ``_stage_hashes`` lets the
+    orchestrator reuse per-vehicle results when only one vehicle changed.
+    """
+    # Build UI context using builder pattern
+    logger.info("Building UI context...")
+    context_director = ContextDirector(_data_tables)
+    ui_context = context_director.build_ui_context(_sidebar_inputs)
+    logger.debug("UI context built successfully.")
+
+    # Perform calculations (imported here so the sidebar can render before
+    # the calculation services are loaded)
+    from tco_app.ui.orchestration import CalculationOrchestrator
+
+    logger.info("Starting calculations...")
+    calculation_orchestrator = CalculationOrchestrator(
+        _data_tables, ui_context, _stage_hashes
+    )
+    context = calculation_orchestrator.perform_calculations()
+    # Pages key their own render caches (e.g. Plotly figures) on this
+    context["input_hash"] = input_hash
+    return context
+
+
+_SIDEBAR_INPUTS_KEY = "sidebar_inputs"
+_SIDEBAR_HASH_KEY = "sidebar_input_hash"
+_FULL_RUN_KEY = "sidebar_full_run"
+
+
+@st.fragment
+def _sidebar_fragment(data_tables: Dict[str, Any]) -> None:
+    """Render the sidebar inputs as a fragment and publish them to session state.
+
+    A widget change inside the fragment reruns only the sidebar. The whole app
+    is rerun only when the resulting inputs hash differently (e.g. not while a
+    charging mix is still being adjusted towards 100%), so the calculation and
+    plotting pipeline is skipped for interactions that cannot change results.
+    """
+    inputs = SidebarRenderer(data_tables).render_inputs()
+    input_hash = generate_input_hash(inputs)
+    previous_hash = st.session_state.get(_SIDEBAR_HASH_KEY)
+
+    st.session_state[_SIDEBAR_INPUTS_KEY] = inputs
+    st.session_state[_SIDEBAR_HASH_KEY] = input_hash
+
+    if not st.session_state.get(_FULL_RUN_KEY) and input_hash != previous_hash:
+        st.rerun()
+
+
 def get_context() -> Dict[str, Any]:
     """Return cached modelling context using builder pattern."""
-    logger.info("Attempting to get context...")
+    logger.debug("Attempting to get context...")
 
     # Load data
     logger.debug("Loading data...")
@@ -26,43 +88,46 @@ def get_context() -> Dict[str, Any]:
     logger.debug("Data loaded successfully.")
 
     # Always render sidebar to collect inputs
-    logger.info("Rendering sidebar and collecting inputs...")
-    sidebar_renderer = SidebarRenderer(data_tables)
-    sidebar_inputs = sidebar_renderer.render_and_collect_inputs()
-    
-    # Generate hash of current inputs
-    current_input_hash = generate_input_hash(sidebar_inputs)
+    logger.debug("Rendering sidebar and collecting inputs...")
+    st.session_state[_FULL_RUN_KEY] = True
+    try:
+        with st.sidebar:
+            _sidebar_fragment(data_tables)
+    finally:
+        st.session_state[_FULL_RUN_KEY] = False
+    sidebar_inputs = st.session_state[_SIDEBAR_INPUTS_KEY]
     
+    # An incomplete charging mix cannot be calculated; stop the rerun here
+    # rather than running the pipeline on a fallback charging option.
+    if not sidebar_inputs.get("charging_mix_valid", True):
+        st.warning(
+            f"Adjust the charging mix to total {UI_CONFIG.CHARGING_MIX_TOTAL}% to update the results."
+        )
+        st.stop()
+
+    # Fingerprint each calculation stage
+    stage_hashes = generate_stage_hashes(sidebar_inputs)
+    current_input_hash = stage_hashes["context"]
+
     # Check if we have a cached context and if inputs haven't changed
-    if (
-        "ctx_cache" in st.session_state
-        and "ctx_input_hash" in st.session_state
-        and st.session_state["ctx_input_hash"] == current_input_hash
-    ):
-        logger.info("Returning cached context (inputs unchanged).")
+    cached_hashes = st.session_state.get("ctx_stage_hashes")
+    if "ctx_cache" in st.session_state and cached_hashes == stage_hashes:
+        logger.debug("Returning cached context (inputs unchanged).")
         # Show caption for active scenario
         st.caption(f'Scenario: {sidebar_inputs["scenario_meta"]["name"]}')
         return st.session_state["ctx_cache"]
 
     logger.info("Inputs changed or no cache found, computing new context...")
-
-    # Build UI context using builder pattern
-    logger.info("Building UI context...")
-    context_director = ContextDirector(data_tables)
-    ui_context = context_director.build_ui_context(sidebar_inputs)
-    logger.debug("UI context built successfully.")
-
-    # Perform calculations
-    logger.info("Starting calculations...")
-    calculation_orchestrator = CalculationOrchestrator(data_tables, ui_context)
-    complete_context = calculation_orchestrator.perform_calculations()
+    complete_context = _compute_context(
+        current_input_hash, data_tables, sidebar_inputs, stage_hashes
+    )
 
     # Show caption for active scenario
-    st.caption(f'Scenario: {ui_context["scenario_meta"]["name"]}')
+    st.caption(f'Scenario: {sidebar_inputs["scenario_meta"]["name"]}')
 
-    # Cache context and input hash
+    # Cache context and the stage hashes it was built from
     st.session_state["ctx_cache"] = complete_context
-    st.session_state["ctx_input_hash"] = current_input_hash
-    logger.info("Context computed and cached with input hash.")
+    st.session_state["ctx_stage_hashes"] = stage_hashes
+    logger.info("Context computed and cached with stage hashes.")
     
     return complete_context
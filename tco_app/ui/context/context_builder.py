@@ -1,6 +1,33 @@
 """Context director for orchestrating UI context building."""
 
 from tco_app.src import Any, Dict, pd
+from tco_app.src.constants import DataColumns
+
+# Vehicle columns read by the calculation pipeline and result pages. Anything
+# else (e.g. the comparison pair used only by the vehicle selector) is dropped
+# before the table is handed to the orchestrator.
+_REQUIRED_VEHICLE_COLUMNS = (
+    DataColumns.VEHICLE_ID,
+    DataColumns.VEHICLE_TYPE,
+    DataColumns.VEHICLE_DRIVETRAIN,
+    DataColumns.VEHICLE_MODEL,
+    DataColumns.PAYLOAD_T,
+    DataColumns.MSRP_PRICE,
+    DataColumns.RANGE_KM,
+    DataColumns.BATTERY_CAPACITY_KWH,
+    DataColumns.KWH_PER100KM,
+    DataColumns.LITRES_PER100KM,
+)
+
+
+def _project_vehicle_models(vehicle_models: pd.DataFrame) -> pd.DataFrame:
+    """Return *vehicle_models* narrowed to the columns calculations need."""
+    columns = [
+        col.value
+        for col in _REQUIRED_VEHICLE_COLUMNS
+        if col.value in vehicle_models.columns
+    ]
+    return vehicle_models[columns]
 
 
 class ContextDirector:
@@ -11,12 +38,22 @@ class ContextDirector:
 
     def build_ui_context(self, sidebar_inputs: Dict[str, Any]) -> Dict[str, Any]:
         """Build complete UI context from pre-collected sidebar inputs.
-        
+
         Args:
             sidebar_inputs: Pre-collected inputs from SidebarRenderer
-            
+
         Returns:
             Complete UI context with sidebar inputs
         """
-        # Simply return the sidebar inputs as they already contain everything needed
-        return sidebar_inputs
+        modified_tables = sidebar_inputs.get("modified_tables")
+        if not modified_tables or "vehicle_models" not in modified_tables:
+            return sidebar_inputs
+
+        ui_context = dict(sidebar_inputs)
+        ui_context["modified_tables"] = {
+            **modified_tables,
+            "vehicle_models": _project_vehicle_models(
+                modified_tables["vehicle_models"]
+            ),
+        }
+        return ui_context
@@ -1,40 +1,117 @@
-"""Utility for hashing user inputs to detect changes."""
+"""Utility for hashing user inputs to detect changes.
+
+Stage dependency graph (which inputs invalidate which cached stage)::
+
+    scenario, annual_kms, life, discount_rate, price overrides, charging
+        │
+        ├── + comparison_diesel_id ─────────────────► "diesel"  (diesel TCOResult)
+        │
+        └── + battery overrides, infrastructure,
+              fleet, incentives (BEV-only inputs)
+                │
+                ├── + selected_bev_id ──────────────► "bev"     (BEV TCOResult)
+                └── + both vehicle IDs ─────────────► "context" (comparison + page context)
+
+Only the stages whose fingerprint changed are recomputed; e.g. switching the
+BEV model or toggling incentives reuses the cached diesel result, and both
+incentive states of the BEV result stay cached so toggling back is a lookup.
+"""
 
 import hashlib
-import json
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
+
+from tco_app.src.constants import DataColumns, ParameterKeys
+
+# Primitive sidebar selections that fully determine the calculation context.
+# Derived objects (modified_tables, combined_infrastructure_data, the
+# incentive-flagged table) are deterministic functions of these and are not
+# hashed.
+_VEHICLE_KEYS: Tuple[str, ...] = ("selected_bev_id", "comparison_diesel_id")
+
+# Inputs that affect every vehicle
+_COMMON_INPUT_KEYS: Tuple[str, ...] = (
+    "scenario_id",
+    DataColumns.VEHICLE_TYPE.value,
+    "annual_kms",
+    "truck_life_years",
+    "discount_rate",
+    ParameterKeys.DIESEL_PRICE.value,
+    ParameterKeys.CARBON_PRICE.value,
+    DataColumns.CHARGING_APPROACH.value,
+    "selected_charging",
+)
+
+# Inputs only read on the BEV paths (battery, infrastructure and incentives
+# are all gated on the BEV drivetrain in the calculation service)
+_BEV_ONLY_INPUT_KEYS: Tuple[str, ...] = (
+    "degradation_rate",
+    "replacement_cost",
+    "selected_infrastructure",
+    "fleet_size",
+    "apply_incentives",
+)
+
+
+def _digest(key: Tuple[Any, ...]) -> str:
+    """Return a stable hex digest of *key*.
+
+    The key holds only primitives, so its ``repr`` is canonical. Unlike the
+    built-in ``hash`` (64-bit, with collisions such as ``hash(-1) ==
+    hash(-2)``), a 128-bit BLAKE2b digest is safe to use as the sole key of
+    a cross-session cache.
+    """
+    return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+
+def _common_key(inputs: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return the hashable fingerprint of the inputs every vehicle depends on."""
+    return (
+        tuple(inputs.get(name) for name in _COMMON_INPUT_KEYS),
+        tuple(sorted((inputs.get("charging_mix") or {}).items())),
+    )
+
+
+def _bev_only_key(inputs: Dict[str, Any]) -> Tuple[Any, ...]:
+    """Return the hashable fingerprint of the BEV-only inputs."""
+    return (
+        tuple(inputs.get(name) for name in _BEV_ONLY_INPUT_KEYS),
+        tuple(inputs.get("selected_infrastructure_list") or ()),
+        tuple(sorted(inputs.get("selected_incentives") or ())),
+    )
 
 
 def generate_input_hash(inputs: Dict[str, Any]) -> str:
     """Generate a hash from user inputs to detect changes.
-    
+
+    Args:
+        inputs: Dictionary of user inputs from sidebar
+
+    Returns:
+        Hash of the primitive inputs as a string
+    """
+    key = (
+        tuple(inputs.get(name) for name in _VEHICLE_KEYS),
+        _common_key(inputs),
+        _bev_only_key(inputs),
+    )
+    return _digest(key)
+
+
+def generate_stage_hashes(inputs: Dict[str, Any]) -> Dict[str, str]:
+    """Return one fingerprint per cached calculation stage.
+
     Args:
         inputs: Dictionary of user inputs from sidebar
-        
+
     Returns:
-        SHA256 hash of the inputs
+        Mapping of stage name (``"bev"``, ``"diesel"``, ``"context"``) to the
+        hash of the inputs that stage depends on
     """
-    # Create a copy and remove non-hashable items
-    hashable_inputs = {}
-    
-    for key, value in inputs.items():
-        # Skip dataframes and other non-serialisable objects
-        if key in ["modified_tables", "bev_vehicle_data", "diesel_vehicle_data"]:
-            # For dataframes, we'll use their shape and key values
-            if hasattr(value, "shape"):
-                hashable_inputs[f"{key}_shape"] = str(value.shape)
-            elif isinstance(value, dict):
-                # For modified_tables, just track table names and shapes
-                hashable_inputs[f"{key}_keys"] = sorted(value.keys())
-        elif hasattr(value, "to_dict"):
-            # Handle pandas Series/DataFrames
-            hashable_inputs[key] = value.to_dict()
-        else:
-            # Regular values
-            hashable_inputs[key] = value
-    
-    # Convert to JSON string with sorted keys for consistent hashing
-    json_str = json.dumps(hashable_inputs, sort_keys=True, default=str)
-    
-    # Generate SHA256 hash
-    return hashlib.sha256(json_str.encode()).hexdigest() 
\ No newline at end of file
+    common = _common_key(inputs)
+    return {
+        "bev": _digest(
+            (inputs.get("selected_bev_id"), common, _bev_only_key(inputs))
+        ),
+        "diesel": _digest((inputs.get("comparison_diesel_id"), common)),
+        "context": generate_input_hash(inputs),
+    }
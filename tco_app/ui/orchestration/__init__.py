@@ -1,5 +1,13 @@
 """Orchestration module for coordinating calculations and UI updates."""
 
-from .calculation_orchestrator import CalculationOrchestrator
+__all__ = ['CalculationOrchestrator']
 
-__all__ = ['CalculationOrchestrator'] 
\ No newline at end of file
+
+def __getattr__(name):
+    # Deferred so importing the UI package does not pull in the calculation
+    # services until the first calculation runs
+    if name == "CalculationOrchestrator":
+        from .calculation_orchestrator import CalculationOrchestrator
+
+        return CalculationOrchestrator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
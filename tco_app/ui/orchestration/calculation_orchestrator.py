@@ -1,27 +1,82 @@
 """Orchestrates TCO calculations after UI context is built."""
 
 from tco_app.repositories import ParametersRepository, VehicleRepository
-from tco_app.services.dtos import CalculationParameters, CalculationRequest
+from tco_app.services.dtos import (
+    CalculationParameters,
+    CalculationRequest,
+    VehiclePairResults,
+)
 from tco_app.services.tco_calculation_service import (
     ComparisonResult,
     TCOCalculationService,
     TCOResult,
 )
-from tco_app.src import Any, Dict, logging, pd
+from tco_app.src import PERFORMANCE_CONFIG, Any, Dict, Optional, logging, pd, st
 from tco_app.src.constants import DataColumns, Drivetrain, ParameterKeys
 from tco_app.src.exceptions import CalculationError, VehicleNotFoundError
 
 logger = logging.getLogger(__name__)
 
 
+def _description_positions(df: pd.DataFrame, description_col: str) -> Dict[str, int]:
+    """Map each parameter description to its (first) row position in *df*.
+
+    Resolving positions in one pass lets overrides be written with ``.iat``
+    instead of a full boolean mask per parameter.
+    """
+    positions: Dict[str, int] = {}
+    for pos, description in enumerate(df[description_col].tolist()):
+        positions.setdefault(description, pos)
+    return positions
+
+
+def _with_overrides(
+    df: pd.DataFrame, value_pos: int, overrides: Dict[int, Any]
+) -> pd.DataFrame:
+    """Return *df* with ``{row: value}`` written into column *value_pos*.
+
+    Overrides that match the current value are dropped; if none remain the
+    original frame is returned as-is instead of paying for a full copy.
+    """
+    changed = {
+        row: value for row, value in overrides.items() if df.iat[row, value_pos] != value
+    }
+    if not changed:
+        return df
+    df_copy = df.copy()
+    for row, value in changed.items():
+        df_copy.iat[row, value_pos] = value
+    return df_copy
+
+
+@st.cache_data(show_spinner=False, max_entries=PERFORMANCE_CONFIG.DEFAULT_CACHE_SIZE)
+def _cached_vehicle_tco(
+    stage_hash: str,
+    _tco_service: TCOCalculationService,
+    _request: CalculationRequest,
+) -> TCOResult:
+    """Return the TCO for one vehicle, memoised on its stage fingerprint.
+
+    ``stage_hash`` covers the vehicle ID plus every shared input (see
+    :mod:`tco_app.ui.context.input_hash`), so changing only the other vehicle
+    in the comparison is served from the cache.
+    """
+    return _tco_service.calculate_single_vehicle_tco(_request)
+
+
 class CalculationOrchestrator:
     """Orchestrates TCO calculations using UI context."""
 
     def __init__(
-        self, data_tables: Dict[str, pd.DataFrame], ui_context: Dict[str, Any]
+        self,
+        data_tables: Dict[str, pd.DataFrame],
+        ui_context: Dict[str, Any],
+        stage_hashes: Optional[Dict[str, str]] = None,
     ):
         self.data_tables = data_tables
         self.ui_context = ui_context
+        # Per-vehicle fingerprints; when given, single-vehicle results are cached
+        self.stage_hashes = stage_hashes
         # modified_tables contains tables after scenario application.
         # These should be passed to the repositories if the repositories are expected
         # to serve scenario-modified data. Or, ensure scenarios are applied before data_tables
@@ -37,13 +92,74 @@ class CalculationOrchestrator:
         self.tco_service = TCOCalculationService(
             vehicle_repo=self.vehicle_repo, params_repo=self.params_repo
         )
+        # Repository tables, read once per orchestrator (see _repository_tables)
+        self._repo_tables: Optional[Dict[str, pd.DataFrame]] = None
+        # description column -> (frame, {description: row position})
+        self._description_rows: Dict[str, Any] = {}
+
+    def _rows_by_description(
+        self, df: pd.DataFrame, description_col: str
+    ) -> Dict[str, int]:
+        """Return the description → row position map for *df*, built once.
 
-    def _build_calculation_request(self, vehicle_id: str) -> CalculationRequest:
-        """Build a CalculationRequest from UI context and data tables."""
+        The map is reused while the same frame is passed in, which is the case
+        for the repository tables every request of this orchestrator shares.
+        """
+        cached = self._description_rows.get(description_col)
+        if cached is not None and cached[0] is df:
+            return cached[1]
+        rows = _description_positions(df, description_col)
+        self._description_rows[description_col] = (df, rows)
+        return rows
 
-        vehicle_data_series = self.vehicle_repo.get_vehicle_by_id(vehicle_id)
-        fees_data_series = self.vehicle_repo.get_fees_by_vehicle_id(vehicle_id)
+    def _repository_tables(self) -> Dict[str, pd.DataFrame]:
+        """Return the parameter and reference tables, read on first use.
 
+        The tables depend only on ``modified_tables``, not on the UI context,
+        so every request built by this orchestrator shares one read (and one
+        defensive copy) of each instead of going back to the repository.
+        """
+        if self._repo_tables is None:
+            # Get incentives from modified tables if available, otherwise from repo
+            incentives = self.modified_tables.get("incentives")
+            if incentives is None or incentives.empty:
+                incentives = self.params_repo.get_incentives()
+
+            self._repo_tables = {
+                "financial_params": self.params_repo.get_financial_params(),
+                "battery_params": self.params_repo.get_battery_params(),
+                "charging_options": self.params_repo.get_charging_options(),
+                "infrastructure_options": self.params_repo.get_infrastructure_options(),
+                "emission_factors": self.params_repo.get_emission_factors(),
+                "externalities_data": self.params_repo.get_externalities_data(),
+                "incentives": incentives,
+            }
+        return self._repo_tables
+
+    def _build_calculation_request(
+        self, vehicle_id: str, shared_inputs: Optional[Dict[str, Any]] = None
+    ) -> CalculationRequest:
+        """Build a CalculationRequest from UI context and data tables.
+
+        ``shared_inputs`` is the vehicle-independent part returned by
+        :meth:`_build_shared_inputs`; it is rebuilt when not supplied.
+        """
+        if shared_inputs is None:
+            shared_inputs = self._build_shared_inputs()
+
+        return CalculationRequest(
+            vehicle_data=self.vehicle_repo.get_vehicle_by_id(vehicle_id),
+            fees_data=self.vehicle_repo.get_fees_by_vehicle_id(vehicle_id),
+            **shared_inputs,
+        )
+
+    def _build_shared_inputs(self) -> Dict[str, Any]:
+        """Build the request inputs that are identical for every vehicle.
+
+        Parameters, UI-adjusted tables and reference data depend only on the UI
+        context, so they are resolved once per orchestration and shared by the
+        BEV and diesel requests instead of being copied and re-filtered twice.
+        """
         # Build parameters from UI context
         # Note: selected_charging and selected_infrastructure from UI context are IDs.
         parameters = CalculationParameters(
@@ -71,27 +187,19 @@ class CalculationOrchestrator:
             replacement_cost_override=self.ui_context.get("replacement_cost"),
         )
 
-        # Parameters like diesel_price_override from CalculationParameters are intended to inform
-        # how the financial_params DataFrame (and others) might be adjusted.
-        # This adjustment should happen *before* creating the CalculationRequest,
-        # or the TCOCalculationService needs to be aware of these overrides.
-        # For now, we pass the already modified tables (from scenarios) and the override params.
-        # The _apply_ui_overrides_to_params method mentioned in the plan would handle this.
+        tables = self._repository_tables()
 
+        # UI overrides are applied to copies of the (scenario-modified) tables
+        # before the request is created, so the service sees final values.
         financial_params_for_request = self._apply_ui_overrides_to_financial_params(
-            self.params_repo.get_financial_params(), parameters
+            tables["financial_params"], parameters
         )
         battery_params_for_request = self._apply_ui_overrides_to_battery_params(
-            self.params_repo.get_battery_params(), parameters
+            tables["battery_params"], parameters
         )
 
-        # Get incentives from modified tables if available, otherwise from repo
-        incentives_for_request = self.modified_tables.get("incentives")
-        if incentives_for_request is None or incentives_for_request.empty:
-            incentives_for_request = self.params_repo.get_incentives()
-
         # Handle infrastructure options - check if we have combined infrastructure data
-        infrastructure_options = self.params_repo.get_infrastructure_options()
+        infrastructure_options = tables["infrastructure_options"]
         combined_infrastructure_data = self.ui_context.get("combined_infrastructure_data")
         
         if combined_infrastructure_data is not None and not combined_infrastructure_data.empty:
@@ -102,106 +210,112 @@ class CalculationOrchestrator:
             infrastructure_options = pd.concat([infrastructure_options, combined_df], ignore_index=True)
             logger.debug(f"Added combined infrastructure with ID {combined_infrastructure_data[DataColumns.INFRASTRUCTURE_ID]}")
 
-        return CalculationRequest(
-            vehicle_data=vehicle_data_series,
-            fees_data=fees_data_series,
-            parameters=parameters,
-            charging_options=self.params_repo.get_charging_options(),
-            infrastructure_options=infrastructure_options,  # Pass the modified options
-            financial_params=financial_params_for_request,  # Pass the adjusted DF
-            battery_params=battery_params_for_request,  # Pass the adjusted DF
-            emission_factors=self.params_repo.get_emission_factors(),
-            externalities_data=self.params_repo.get_externalities_data(),
-            incentives=incentives_for_request,  # Use modified incentives from UI
-        )
+        return {
+            "parameters": parameters,
+            "charging_options": tables["charging_options"],
+            "infrastructure_options": infrastructure_options,  # Pass the modified options
+            "financial_params": financial_params_for_request,  # Pass the adjusted DF
+            "battery_params": battery_params_for_request,  # Pass the adjusted DF
+            "emission_factors": tables["emission_factors"],
+            "externalities_data": tables["externalities_data"],
+            "incentives": tables["incentives"],  # Use modified incentives from UI
+        }
 
     def _apply_ui_overrides_to_financial_params(
         self, financial_params_df: pd.DataFrame, calc_params: CalculationParameters
     ) -> pd.DataFrame:
-        """Apply UI overrides to a copy of the financial parameters DataFrame."""
+        """Return the financial parameters with UI overrides applied.
+
+        The input frame is returned untouched when no override changes a value;
+        otherwise a copy is modified.
+        """
         if financial_params_df.empty:
             return pd.DataFrame()
-        df_copy = financial_params_df.copy()
-        if calc_params.diesel_price_override is not None:
-            mask = (
-                df_copy[DataColumns.FINANCE_DESCRIPTION] == ParameterKeys.DIESEL_PRICE
-            )
-            df_copy.loc[mask, DataColumns.FINANCE_DEFAULT_VALUE] = (
-                calc_params.diesel_price_override
-            )
-        if calc_params.carbon_price_override is not None:
-            mask = (
-                df_copy[DataColumns.FINANCE_DESCRIPTION] == ParameterKeys.CARBON_PRICE
-            )
-            df_copy.loc[mask, DataColumns.FINANCE_DEFAULT_VALUE] = (
-                calc_params.carbon_price_override
+        rows = self._rows_by_description(
+            financial_params_df, DataColumns.FINANCE_DESCRIPTION
+        )
+        value_pos = financial_params_df.columns.get_loc(
+            DataColumns.FINANCE_DEFAULT_VALUE.value
+        )
+        overrides = {
+            rows[key.value]: value
+            for key, value in (
+                (ParameterKeys.DIESEL_PRICE, calc_params.diesel_price_override),
+                (ParameterKeys.CARBON_PRICE, calc_params.carbon_price_override),
             )
+            if value is not None and key.value in rows
+        }
         # Add more overrides here if needed
-        return df_copy
+        return _with_overrides(financial_params_df, value_pos, overrides)
 
     def _apply_ui_overrides_to_battery_params(
         self, battery_params_df: pd.DataFrame, calc_params: CalculationParameters
     ) -> pd.DataFrame:
-        """Apply UI overrides to a copy of the battery parameters DataFrame."""
+        """Return the battery parameters with UI overrides applied.
+
+        The input frame is returned untouched when no override changes a value;
+        otherwise a copy is modified.
+        """
         if battery_params_df.empty:
             logger.warning(
                 "Battery parameters DataFrame is empty. Cannot apply UI overrides."
             )
             return pd.DataFrame()
 
-        df_copy = battery_params_df.copy()
-
         # Ensure the required columns exist
         description_col = "battery_description"  # Match actual CSV column name
         value_col = "default_value"  # Based on data/dictionary/battery_params.csv
 
-        if description_col not in df_copy.columns or value_col not in df_copy.columns:
+        if (
+            description_col not in battery_params_df.columns
+            or value_col not in battery_params_df.columns
+        ):
             logger.error(
                 f"Battery parameters DataFrame is missing required columns: '{description_col}' or '{value_col}'. Cannot apply overrides."
             )
-            return df_copy  # Return original copy if columns are missing
-
-        if calc_params.degradation_rate_override is not None:
-            mask = df_copy[description_col] == ParameterKeys.DEGRADATION_RATE.value
-            if mask.any():
-                df_copy.loc[mask, value_col] = calc_params.degradation_rate_override
-                logger.debug(
-                    f"Applied degradation_rate_override: {calc_params.degradation_rate_override}"
-                )
-            else:
-                logger.warning(
-                    f"Parameter key '{ParameterKeys.DEGRADATION_RATE.value}' not found in battery_params_df description column."
-                )
+            return battery_params_df  # Return original if columns are missing
 
-        if calc_params.replacement_cost_override is not None:
-            mask = df_copy[description_col] == ParameterKeys.REPLACEMENT_COST.value
-            if mask.any():
-                df_copy.loc[mask, value_col] = calc_params.replacement_cost_override
-                logger.debug(
-                    f"Applied replacement_cost_override: {calc_params.replacement_cost_override}"
-                )
+        rows = self._rows_by_description(battery_params_df, description_col)
+        value_pos = battery_params_df.columns.get_loc(value_col)
+        overrides: Dict[int, Any] = {}
+
+        for key, value in (
+            (ParameterKeys.DEGRADATION_RATE, calc_params.degradation_rate_override),
+            (ParameterKeys.REPLACEMENT_COST, calc_params.replacement_cost_override),
+        ):
+            if value is None:
+                continue
+            row = rows.get(key.value)
+            if row is not None:
+                overrides[row] = value
+                logger.debug(f"Applied {key.value} override: {value}")
             else:
                 logger.warning(
-                    f"Parameter key '{ParameterKeys.REPLACEMENT_COST.value}' not found in battery_params_df description column."
+                    f"Parameter key '{key.value}' not found in battery_params_df description column."
                 )
 
-        return df_copy
+        return _with_overrides(battery_params_df, value_pos, overrides)
 
     def perform_calculations(self) -> Dict[str, Any]:
         """Perform all TCO calculations and return complete context."""
-        logger.info("Starting TCO calculations using new TCOCalculationService...")
+        logger.debug("Starting TCO calculations using new TCOCalculationService...")
 
         try:
+            shared_inputs = self._build_shared_inputs()
             bev_request = self._build_calculation_request(
-                self.ui_context["selected_bev_id"]
+                self.ui_context["selected_bev_id"], shared_inputs
             )
             diesel_request = self._build_calculation_request(
-                self.ui_context["comparison_diesel_id"]
+                self.ui_context["comparison_diesel_id"], shared_inputs
             )
 
             comparison_result = self.tco_service.compare_vehicles(
                 base_vehicle_request=bev_request,  # Assuming BEV is the base for comparison metrics
                 comparison_vehicle_request=diesel_request,
+                base_tco_result=self._cached_vehicle_result("bev", bev_request),
+                comparison_tco_result=self._cached_vehicle_result(
+                    "diesel", diesel_request
+                ),
             )
 
             # Always return DTOs directly
@@ -226,6 +340,14 @@ class CalculationOrchestrator:
             # return self._empty_results_placeholder()
             raise
 
+    def _cached_vehicle_result(
+        self, stage: str, request: CalculationRequest
+    ) -> Optional[TCOResult]:
+        """Return the cached result for *stage*, or None to compute it inline."""
+        if not self.stage_hashes or stage not in self.stage_hashes:
+            return None
+        return _cached_vehicle_tco(self.stage_hashes[stage], self.tco_service, request)
+
     def _prepare_dto_results(
         self,
         comparison: ComparisonResult,
@@ -233,33 +355,19 @@ class CalculationOrchestrator:
         diesel_request: CalculationRequest,
     ) -> Dict[str, Any]:
         """Prepare results with DTOs for components that support them."""
-        # Add context data to the DTOs
+        # The service already stamps each result with its request's vehicle
+        # data, annual_kms and truck_life_years
         bev_result = comparison.base_vehicle_result
         diesel_result = comparison.comparison_vehicle_result
-        
-        # Store request data on the DTOs for UI components that need it
-        bev_result.vehicle_data = bev_request.vehicle_data
-        diesel_result.vehicle_data = diesel_request.vehicle_data
-        
-        # Store annual_kms and truck_life_years on DTOs if not already there
-        bev_result.annual_kms = bev_request.parameters.annual_kms
-        bev_result.truck_life_years = bev_request.parameters.truck_life_years
-        diesel_result.annual_kms = diesel_request.parameters.annual_kms
-        diesel_result.truck_life_years = diesel_request.parameters.truck_life_years
-        
+
         return {
             "bev_results": bev_result,  # Return DTO directly
             "diesel_results": diesel_result,  # Return DTO directly
             "comparison": comparison,  # Return ComparisonResult DTO
-            # Legacy fields for compatibility
-            "comparison_metrics": {
-                "upfront_cost_difference": comparison.upfront_cost_difference,
-                "annual_operating_savings": comparison.annual_operating_cost_savings,
-                "price_parity_year": comparison.payback_period_years,
-                "emission_savings_lifetime": comparison.emissions_reduction_lifetime_co2e,
-                "abatement_cost": comparison.abatement_cost,
-                "bev_to_diesel_tco_ratio": comparison.bev_to_diesel_tco_ratio,
-            },
+            # Columnar (bev, diesel) view of the headline metrics
+            "vehicle_pair_results": VehiclePairResults.from_results(
+                bev_result, diesel_result
+            ),
             # Keep other context data for pages that need it
             "annual_kms": self.ui_context["annual_kms"],
             "truck_life_years": self.ui_context["truck_life_years"],
@@ -283,6 +391,7 @@ class CalculationOrchestrator:
             # Vehicle data for sensitivity page
             "bev_vehicle_data": bev_request.vehicle_data,
             "diesel_vehicle_data": diesel_request.vehicle_data,
-            "bev_fees": pd.DataFrame([bev_request.fees_data]) if isinstance(bev_request.fees_data, pd.Series) else bev_request.fees_data,
-            "diesel_fees": pd.DataFrame([diesel_request.fees_data]) if isinstance(diesel_request.fees_data, pd.Series) else diesel_request.fees_data,
+            # Fees rows are passed through as-is; the sensitivity adapter accepts Series
+            "bev_fees": bev_request.fees_data,
+            "diesel_fees": diesel_request.fees_data,
         }
@@ -3,7 +3,7 @@ from tco_app.plotters import (
     create_charging_mix_chart,
     create_cost_breakdown_chart,
 )
-from tco_app.src import st
+from tco_app.src import pd, st
 from tco_app.src.constants import DataColumns, Drivetrain
 from tco_app.ui.context import get_context
 from tco_app.ui.utils.dto_accessors import (
@@ -25,6 +25,49 @@ from tco_app.ui.utils.dto_accessors import (
 )
 
 
+def _metrics_table(rows):
+    """Return ``(label, formatted value)`` rows as a one-column table.
+
+    A section is sent to the frontend as a single ``st.table`` element rather
+    than one ``st.metric`` per value.
+    """
+    labels, values = zip(*rows)
+    return pd.DataFrame({"Value": values}, index=pd.Index(labels, name="Metric"))
+
+
+def _build_charts(bev_results, diesel_results, truck_life_years, payload_penalties):
+    """Return the (cost breakdown, charging mix, annual costs) figures.
+
+    The charging mix figure is ``None`` when the BEV has no charging mix.
+    """
+    return (
+        create_cost_breakdown_chart(bev_results, diesel_results, payload_penalties),
+        (
+            create_charging_mix_chart(bev_results)
+            if has_charging_mix(bev_results)
+            else None
+        ),
+        create_annual_costs_chart(
+            bev_results, diesel_results, truck_life_years, payload_penalties
+        ),
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _cached_charts(
+    input_hash, _bev_results, _diesel_results, _truck_life_years, _payload_penalties
+):
+    """Return :func:`_build_charts` for the context fingerprinted by *input_hash*.
+
+    The figures are a pure function of the context, and ``st.plotly_chart``
+    only serialises them, so one set is shared across reruns and sessions
+    without being rebuilt or pickled.
+    """
+    return _build_charts(
+        _bev_results, _diesel_results, _truck_life_years, _payload_penalties
+    )
+
+
 def render():
     ctx = get_context()
     bev_results = ctx["bev_results"]
@@ -36,8 +79,18 @@ def render():
     if "comparison" in ctx and hasattr(ctx["comparison"], "payload_penalties"):
         payload_penalties = ctx["comparison"].payload_penalties
 
+    input_hash = ctx.get("input_hash")
+    if input_hash is None:
+        charts = _build_charts(
+            bev_results, diesel_results, truck_life_years, payload_penalties
+        )
+    else:
+        charts = _cached_charts(
+            input_hash, bev_results, diesel_results, truck_life_years, payload_penalties
+        )
+    chart, cm_chart, annual_chart = charts
+
     st.subheader("Lifetime Cost Components")
-    chart = create_cost_breakdown_chart(bev_results, diesel_results, payload_penalties)
     st.plotly_chart(chart, use_container_width=True)
     
     # Display payload penalty information if it exists
@@ -50,68 +103,63 @@ def render():
         )
 
     # Charging mix visual
-    if has_charging_mix(bev_results):
+    if cm_chart is not None:
         st.subheader("Charging Mix")
-        cm_chart = create_charging_mix_chart(bev_results)
         st.plotly_chart(cm_chart, use_container_width=True)
 
     # Infrastructure + charging requirements
     if is_bev(bev_results):
         st.subheader("Infrastructure Costs")
-        infra_col1, infra_col2 = st.columns(2)
-        with infra_col1:
-            st.metric(
+        infra_rows = [
+            (
                 "Infrastructure Capital Cost",
                 f"${get_infrastructure_price(bev_results):,.0f}",
-            )
-            st.metric(
+            ),
+            (
                 "Annual Maintenance",
                 f"${get_infrastructure_annual_maintenance(bev_results):,.0f}/year",
-            )
-            st.metric(
+            ),
+            (
                 "Cost Per Vehicle",
                 f"${get_infrastructure_npv_per_vehicle(bev_results) or 0:,.0f}",
-            )
-        with infra_col2:
-            st.metric(
-                "Service Life",
-                f"{get_infrastructure_service_life(bev_results)} years",
-            )
-            st.metric(
+            ),
+            ("Service Life", f"{get_infrastructure_service_life(bev_results)} years"),
+            (
                 "Replacement Cycles",
                 f"{get_infrastructure_replacement_cycles(bev_results)}",
-            )
-            subsidy_rate = get_infrastructure_subsidy_rate(bev_results)
-            if subsidy_rate > 0:
-                st.metric(
+            ),
+        ]
+        subsidy_rate = get_infrastructure_subsidy_rate(bev_results)
+        if subsidy_rate > 0:
+            infra_rows.append(
+                (
                     "Infrastructure Subsidy",
-                    f"${get_infrastructure_subsidy_amount(bev_results):,.0f}",
-                    delta=f"{subsidy_rate * 100:.0f}%",
+                    f"${get_infrastructure_subsidy_amount(bev_results):,.0f} "
+                    f"({subsidy_rate * 100:.0f}%)",
                 )
+            )
+        st.table(_metrics_table(infra_rows))
 
         st.subheader("Charging Requirements")
-        cc1, cc2 = st.columns(2)
-        with cc1:
-            st.metric(
-                "Daily Energy Required",
-                f"{get_daily_kwh_required(bev_results):.1f} kWh",
-            )
-            st.metric(
-                "Charging Time Per Day",
-                f"{get_charging_time_per_day(bev_results):.2f} hours",
-            )
-        with cc2:
-            st.metric(
-                "Charger Power",
-                f"{get_charger_power(bev_results):.0f} kW",
-            )
-            st.metric(
-                "Maximum Vehicles Per Charger",
-                f"{min(100, get_max_vehicles_per_charger(bev_results)):.1f}",
+        st.table(
+            _metrics_table(
+                [
+                    (
+                        "Daily Energy Required",
+                        f"{get_daily_kwh_required(bev_results):.1f} kWh",
+                    ),
+                    (
+                        "Charging Time Per Day",
+                        f"{get_charging_time_per_day(bev_results):.2f} hours",
+                    ),
+                    ("Charger Power", f"{get_charger_power(bev_results):.0f} kW"),
+                    (
+                        "Maximum Vehicles Per Charger",
+                        f"{min(100, get_max_vehicles_per_charger(bev_results)):.1f}",
+                    ),
+                ]
             )
+        )
 
     st.subheader("Costs Over Time")
-    annual_chart = create_annual_costs_chart(
-        bev_results, diesel_results, truck_life_years, payload_penalties
-    )
     st.plotly_chart(annual_chart, use_container_width=True, key="annual_costs_chart")
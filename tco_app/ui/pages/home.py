@@ -12,10 +12,9 @@ def render():
     ctx = get_context()
     bev_results = ctx["bev_results"]
     diesel_results = ctx["diesel_results"]
-    comparison_metrics = ctx["comparison_metrics"]
 
     display_summary_metrics(bev_results, diesel_results)
-    display_comparison_metrics(comparison_metrics)
+    display_comparison_metrics(ctx["comparison"])
     
     # Display payload penalty warning if applicable
     if "comparison" in ctx and hasattr(ctx["comparison"], "payload_penalties"):
@@ -1,57 +1,22 @@
 """Sensitivity analysis page module."""
-import streamlit as st
-from typing import List
 import traceback
-import sys
-import os
-import importlib.util
-
-# Add debugging info for deployment environments
-if st.session_state.get("debug_mode", False):
-    st.sidebar.write("Debug Info:")
-    st.sidebar.write(f"Python version: {sys.version}")
-    st.sidebar.write(f"Python path: {sys.path[:3]}")
-    st.sidebar.write(f"Current working directory: {os.getcwd()}")
-
-try:
-    # Add the project root to the Python path if needed
-    project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
-    if project_root not in sys.path:
-        sys.path.insert(0, project_root)
-    
-    from tco_app.ui.context import get_context
-    from tco_app.domain.sensitivity import (
-        perform_sensitivity_analysis_with_dtos, 
-        create_sensitivity_adapter
-    )
-    from tco_app.plotters import create_payload_sensitivity_chart, create_sensitivity_chart
-    
-    # Import sensitivity components using the method that works in Streamlit Cloud
-    # Based on debug output, method 3 (path manipulation) works reliably
-    components_dir = os.path.join(project_root, 'tco_app', 'ui', 'components')
-    if components_dir not in sys.path:
-        sys.path.insert(0, components_dir)
-    
-    try:
-        # Try direct import first (Method 3 from debug)
-        import sensitivity_components
-        SensitivityContext = sensitivity_components.SensitivityContext
-        ParameterRangeCalculator = sensitivity_components.ParameterRangeCalculator
-    except ImportError:
-        # Fallback to importlib (Method 4 from debug)
-        sensitivity_file = os.path.join(components_dir, 'sensitivity_components.py')
-        spec = importlib.util.spec_from_file_location("sensitivity_components", sensitivity_file)
-        sensitivity_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(sensitivity_module)
-        SensitivityContext = sensitivity_module.SensitivityContext
-        ParameterRangeCalculator = sensitivity_module.ParameterRangeCalculator
-    
-    from tco_app.services.dtos import SensitivityRequest
-except ImportError as e:
-    st.error(f"Import Error: {str(e)}")
-    st.error("Full traceback:")
-    st.code(traceback.format_exc())
-    st.stop()
+from typing import Optional, Tuple
+
+from tco_app.domain.sensitivity import (
+    create_sensitivity_adapter,
+    perform_sensitivity_analysis_with_dtos,
+)
+from tco_app.plotters import create_payload_sensitivity_chart, create_sensitivity_chart
+from tco_app.repositories import ParametersRepository, VehicleRepository
+from tco_app.services.dtos import SensitivityRequest, VehiclePairResults
+from tco_app.services.tco_calculation_service import TCOCalculationService
+from tco_app.src import st
+from tco_app.src.data_loading import load_data
+from tco_app.ui.components.sensitivity_components import (
+    ParameterRangeCalculator,
+    SensitivityContext,
+)
+from tco_app.ui.context import get_context
 
 
 def render():
@@ -60,8 +25,8 @@ def render():
         # Step 1: Load full context once at the beginning
         full_context = get_context()
         
-        # Step 2: Extract externalities data for later use
-        externalities_data = full_context.get('externalities_data', None)
+        # Step 2: Extract the context fingerprint for later use
+        input_hash = full_context.get('input_hash')
         
         # Step 3: Create SensitivityContext from the full context
         context = SensitivityContext.from_context(full_context)
@@ -69,22 +34,43 @@ def render():
         # Step 4: Display header and info
         _display_header()
 
-        # Step 5: Get parameter selection
-        sensitivity_param = _get_parameter_selection()
+        # Step 5: Parameter selection and analysis rerun on their own
+        _sensitivity_fragment(context, input_hash)
+            
+    except Exception as e:
+        _display_error(e)
+
+
+def _display_error(error: Exception):
+    """Display a rendering error with its traceback."""
+    st.error(f"Error rendering sensitivity page: {str(error)}")
+    st.error("Full traceback:")
+    st.code(traceback.format_exc())
+
+
+@st.fragment
+def _sensitivity_fragment(
+    context: SensitivityContext,
+    input_hash: Optional[str],
+) -> None:
+    """Render the parameter selector and its analysis as a fragment.
 
-        # Step 6: Initialize components
+    Changing the selected parameter reruns only this block; the sidebar,
+    context lookup and header are left as they are. Fragment reruns bypass
+    :func:`render`, so errors are caught here as well.
+    """
+    try:
+        sensitivity_param = _get_parameter_selection()
         range_calculator = ParameterRangeCalculator(num_points=11)
 
-        # Step 7: Perform analysis based on selection
         if sensitivity_param == "Annual Distance (km) with Payload Effect":
             _display_payload_sensitivity(context, range_calculator)
         else:
-            _display_parameter_sensitivity(sensitivity_param, context, range_calculator, externalities_data)
-            
+            _display_parameter_sensitivity(
+                sensitivity_param, context, range_calculator, input_hash
+            )
     except Exception as e:
-        st.error(f"Error rendering sensitivity page: {str(e)}")
-        st.error("Full traceback:")
-        st.code(traceback.format_exc())
+        _display_error(e)
 
 
 def _display_header():
@@ -145,7 +131,7 @@ def _display_parameter_sensitivity(
     param_type: str,
     context: SensitivityContext,
     range_calculator: ParameterRangeCalculator,
-    externalities_data: dict,
+    input_hash: Optional[str] = None,
 ):
     """Display standard parameter sensitivity analysis."""
     # Calculate parameter range based on type
@@ -153,69 +139,116 @@ def _display_parameter_sensitivity(
 
     # Perform sensitivity analysis
     with st.spinner(f"Calculating sensitivity for {param_type}…"):
-        # Always use the DTO-based approach
-        sensitivity_results = _perform_analysis_with_dtos(param_type, param_range, context, externalities_data)
-
-        # Create and display chart
-        chart = create_sensitivity_chart(
-            context.bev_results,
-            context.diesel_results,
-            param_type,
-            param_range,
-            sensitivity_results,
-        )
+        # Always use the DTO-based approach; memoised when the context is fingerprinted
+        if input_hash is None:
+            chart = _build_sensitivity_chart(
+                param_type,
+                param_range,
+                context,
+                _perform_analysis_with_dtos(param_type, param_range, context),
+            )
+        else:
+            chart = _cached_sensitivity_chart(
+                input_hash, param_type, param_range, context
+            )
 
         st.plotly_chart(chart, use_container_width=True, key="sensitivity_chart")
 
 
+def _build_sensitivity_chart(
+    param_type: str,
+    param_range: Tuple[float, ...],
+    context: SensitivityContext,
+    sweep: VehiclePairResults,
+):
+    """Return the sensitivity figure for *sweep*."""
+    return create_sensitivity_chart(
+        context.bev_results,
+        context.diesel_results,
+        param_type,
+        param_range,
+        sweep,
+    )
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _cached_sensitivity_chart(
+    input_hash: str,
+    param_type: str,
+    param_range: Tuple[float, ...],
+    _context: SensitivityContext,
+):
+    """Return :func:`_build_sensitivity_chart` for the fingerprinted context.
+
+    Keyed like :func:`_cached_analysis`; on a hit neither the sweep nor the
+    figure is rebuilt or unpickled, and ``st.plotly_chart`` only serialises
+    the shared figure.
+    """
+    sweep = _cached_analysis(input_hash, param_type, param_range, _context)
+    return _build_sensitivity_chart(param_type, param_range, _context, sweep)
+
+
 def _calculate_parameter_range(
     param_type: str,
     context: SensitivityContext,
     range_calculator: ParameterRangeCalculator,
-) -> List[float]:
+) -> Tuple[float, ...]:
     """Calculate range for a given parameter type."""
-    range_methods = {
-        "Annual Distance (km)": lambda: range_calculator.calculate_annual_distance_range(
-            context.annual_kms
-        ),
-        "Diesel Price ($/L)": lambda: range_calculator.calculate_diesel_price_range(
+    if param_type == "Annual Distance (km)":
+        return range_calculator.calculate_annual_distance_range(context.annual_kms)
+    if param_type == "Diesel Price ($/L)":
+        return range_calculator.calculate_diesel_price_range(
             context.financial_params_with_ui
-        ),
-        "Electricity Price ($/kWh)": (
-            lambda: range_calculator.calculate_electricity_price_range(
-                context.bev_results, context.charging_options, context.selected_charging
-            )
-        ),
-        "Vehicle Lifetime (years)": (
-            lambda: range_calculator.calculate_vehicle_lifetime_range(
-                context.truck_life_years
-            )
-        ),
-        "Discount Rate (%)": lambda: range_calculator.calculate_discount_rate_range(
-            context.discount_rate
-        ),
-    }
+        )
+    if param_type == "Electricity Price ($/kWh)":
+        return range_calculator.calculate_electricity_price_range(
+            context.bev_results, context.charging_options, context.selected_charging
+        )
+    if param_type == "Vehicle Lifetime (years)":
+        return range_calculator.calculate_vehicle_lifetime_range(
+            context.truck_life_years
+        )
+    if param_type == "Discount Rate (%)":
+        return range_calculator.calculate_discount_rate_range(context.discount_rate)
 
-    if param_type not in range_methods:
-        raise ValueError(f"Unknown parameter type: {param_type}")
+    raise ValueError(f"Unknown parameter type: {param_type}")
 
-    return range_methods[param_type]()
+
+@st.cache_resource(show_spinner=False)
+def _sensitivity_service():
+    """Return the TCO service over the shared data tables, built once per process.
+
+    The service and its repositories only read the tables, so one instance
+    serves every sensitivity run.
+    """
+    data_tables = load_data()
+    return TCOCalculationService(
+        VehicleRepository(data_tables), ParametersRepository(data_tables)
+    )
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _cached_analysis(
+    input_hash: str,
+    param_type: str,
+    param_range: Tuple[float, ...],
+    _context: SensitivityContext,
+) -> VehiclePairResults:
+    """Return :func:`_perform_analysis_with_dtos`, memoised per context and sweep.
+
+    ``input_hash`` fingerprints every input the context was built from, so
+    together with the parameter and its range it fully determines the sweep;
+    switching back to an earlier parameter is served from the cache.
+    """
+    return _perform_analysis_with_dtos(param_type, param_range, _context)
 
 
 def _perform_analysis_with_dtos(
-    param_type: str, param_range: List[float], context: SensitivityContext, externalities_data: dict
-) -> dict:
+    param_type: str, param_range: Tuple[float, ...], context: SensitivityContext
+) -> VehiclePairResults:
     """Perform sensitivity analysis using new DTO-based approach."""
-    # If externalities_data is None, load it as a fallback
-    if externalities_data is None:
-        # Import here to avoid circular imports and containerisation issues
-        import tco_app.repositories as repos
-        from tco_app.src.data_loading import load_data
-        
-        data_tables = load_data()
-        params_repo = repos.ParametersRepository(data_tables)
-        externalities_data = params_repo.get_externalities_data()
-    
+    tco_service = _sensitivity_service()
+
     # Create calculation requests using adapter
     bev_request, diesel_request = create_sensitivity_adapter(
         context.bev_vehicle_data,
@@ -227,7 +260,7 @@ def _perform_analysis_with_dtos(
         context.financial_params_with_ui,
         context.battery_params_with_ui,
         context.emission_factors,
-        externalities_data,
+        context.externalities_data,
         context.incentives,
         context.selected_charging,
         context.selected_infrastructure,
@@ -239,17 +272,6 @@ def _perform_analysis_with_dtos(
         context.apply_incentives,
     )
     
-    # Create TCO service
-    # Import here to avoid circular imports and containerisation issues
-    import tco_app.repositories as repos
-    from tco_app.src.data_loading import load_data
-    from tco_app.services.tco_calculation_service import TCOCalculationService
-    
-    data_tables = load_data()
-    vehicle_repo = repos.VehicleRepository(data_tables)
-    params_repo = repos.ParametersRepository(data_tables)
-    tco_service = TCOCalculationService(vehicle_repo, params_repo)
-    
     # Create sensitivity request
     sensitivity_request = SensitivityRequest(
         parameter_name=param_type,
@@ -264,21 +286,5 @@ def _perform_analysis_with_dtos(
         tco_service
     )
     
-    # Convert results to legacy format for compatibility with existing charts
-    legacy_results = []
-    for result in dto_results:
-        legacy_results.append({
-            "parameter_value": result.parameter_value,
-            "bev": {
-                "tco_per_km": result.base_tco_result.tco_per_km,
-                "tco_lifetime": result.base_tco_result.tco_total_lifetime,
-                "annual_operating_cost": result.base_tco_result.annual_operating_cost,
-            },
-            "diesel": {
-                "tco_per_km": result.comparison_tco_result.tco_per_km,
-                "tco_lifetime": result.comparison_tco_result.tco_total_lifetime,
-                "annual_operating_cost": result.comparison_tco_result.annual_operating_cost,
-            },
-        })
-    
-    return legacy_results
+    # Hand the chart the columnar (bev, diesel) arrays directly
+    return VehiclePairResults.from_sensitivity_results(dto_results)